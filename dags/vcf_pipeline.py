@@ -2,7 +2,7 @@
 VCF Processing Pipeline DAG
 
 This DAG orchestrates the VCF processing pipeline:
-1. Shard VCF data into compressed BCF files with indices
+1. Shard VCF data into compressed BCF files with indices, one parallel task per region
 2. Convert BCF shards to TSV (future)
 3. Convert TSV to Parquet (future)
 4. Load Parquet to BigQuery (future)
@@ -10,9 +10,13 @@ This DAG orchestrates the VCF processing pipeline:
 Each task runs in an isolated container with the pipeline code and dependencies.
 """
 
+import re
 from datetime import datetime, timedelta
+from typing import List
 
 from airflow import DAG
+from airflow.decorators import task
+from airflow.operators.python import get_current_context
 from airflow.providers.docker.operators.docker import DockerOperator
 from docker.types import Mount
 
@@ -25,6 +29,59 @@ default_args = {
     'retry_delay': timedelta(minutes=5),
 }
 
+DEFAULT_VCF_SOURCE = '/test_data/sample.vcf.gz'
+
+# Sized to each shard container's 2g mem_limit, with one container per region
+# running at once: every worker is its own interpreter with pysam loaded and
+# holds up to one shard of VCF text. Override with the `shard_workers` and
+# `shard_threads` run conf keys.
+SHARD_WORKERS = 2
+SHARD_THREADS = 2
+
+
+@task
+def plan_shard_commands() -> List[List[str]]:
+    """
+    Build one shard_vcf command per region.
+
+    Regions come from the `regions` (list) or `region` (string) run conf keys.
+    Without either, the source's index is read and every contig with records
+    becomes its own region, so contigs are sharded in parallel.
+    """
+    context = get_current_context()
+    conf = context['dag_run'].conf or {}
+    source = conf.get('vcf_source', DEFAULT_VCF_SOURCE)
+
+    if conf.get('regions'):
+        regions = list(conf['regions'])
+    elif conf.get('region'):
+        regions = [conf['region']]
+    else:
+        # Imported here so DAG parsing does not load pysam
+        from src.tasks.list_contigs import list_contigs_task
+        regions = list_contigs_task(source)
+
+    # Shared by every mapped task so all shards land in one run directory
+    run_id = context['logical_date'].strftime('%Y-%m-%d_%H-%M-%S')
+
+    return [
+        [
+            'python', '-m', 'src.tasks.shard_vcf',
+            source,
+            '--lines-per-shard', str(conf.get('lines_per_shard', 10000)),
+            '--storage-type', 'local',
+            '--storage-base-path', '/data',
+            '--region', region,
+            '--run-id', run_id,
+            '--format', conf.get('shard_format', 'bcf'),
+            '--workers', str(conf.get('shard_workers', SHARD_WORKERS)),
+            '--threads', str(conf.get('shard_threads', SHARD_THREADS)),
+            # Region strings contain ':' and '-'; keep filenames plain
+            '--shard-prefix', re.sub(r'[^A-Za-z0-9_.]+', '_', region),
+        ]
+        for region in regions
+    ]
+
 
 with DAG(
     'vcf_pipeline',
@@ -36,7 +93,8 @@ with DAG(
     tags=['genomics', 'vcf', 'streaming', 'sharding'],
 ) as dag:
 
-    shard_vcf = DockerOperator(
+    # One container per region; regions are independent so this scales with workers
+    shard_vcf = DockerOperator.partial(
         task_id='shard_vcf',
         image='genetic-variants-pipeline:latest',
         api_version='auto',
@@ -44,16 +102,6 @@ with DAG(
         docker_url='unix://var/run/docker.sock',
         network_mode='bridge',
 
-        command=[
-            'python', '-m', 'src.tasks.shard_vcf',
-            # Use Airflow variable/param for source file
-            '{{ dag_run.conf.get("vcf_source", "/test_data/sample.vcf.gz") }}',
-            '--lines-per-shard', '{{ dag_run.conf.get("lines_per_shard", "10000") }}',
-            '--storage-type', 'local',
-            '--storage-base-path', '/data',
-            '--region', '{{ dag_run.conf.get("region", "chr21") }}',
-        ],
-
         mounts=[
             Mount(
                 source='genetic-variants-cloud_pipeline-data',
@@ -70,4 +118,4 @@ with DAG(
 
         mem_limit='2g',
         mount_tmp_dir=False,
-    )
+    ).expand(command=plan_shard_commands())
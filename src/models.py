@@ -1,16 +1,200 @@
 """
 Core data models for the pipeline.
 
-Note: For streaming/sharding, we use pysam.VariantRecord directly.
+Note: For sharding, we use pysam.VariantRecord directly. Streaming consumers that
+only need the fixed VCF columns read them as column-oriented VariantBatch objects,
+with VariantRecord available as a lightweight per-row view.
 Future transformation stages (TSV, Avro) will define their own schemas here.
 """
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-# Placeholder for future transformation schemas
-# Example:
-# class TSVVariantRecord(BaseModel):
-#     """Schema for flattened TSV variant data"""
-#     pass
-#
-# class AvroVariantRecord(BaseModel):
-#     """Schema for Avro variant data"""
-#     pass
+import numpy as np
+
+
+class VariantRecord(NamedTuple):
+    """
+    The fixed (non-INFO/FORMAT) columns of one variant.
+
+    A plain tuple, so construction is cheap enough for per-record use. Values
+    are not checked on construction; call validate() where strict checks are
+    needed, e.g. for records that did not come from htslib.
+    """
+
+    chrom: str
+    pos: int
+    ref: str
+    alts: Tuple[str, ...] = ()
+    id: Optional[str] = None
+    qual: Optional[float] = None
+    filter: Optional[str] = None
+
+    @property
+    def info(self):
+        """
+        Not available: INFO is never read into a VariantRecord.
+
+        Streamers producing VariantRecord skip INFO and FORMAT entirely, which
+        is much of what makes them fast. Stream pysam records (the default
+        "pysam" backend) when INFO fields are needed.
+
+        Raises:
+            NotImplementedError: Always
+        """
+        raise NotImplementedError(
+            "VariantRecord holds only the fixed columns; stream pysam records for INFO fields"
+        )
+
+    def validate(self) -> "VariantRecord":
+        """
+        Check field values.
+
+        Returns:
+            This record, so calls can be chained
+
+        Raises:
+            ValueError: If a field holds an invalid value
+        """
+        if not self.chrom:
+            raise ValueError("Chromosome must not be empty")
+        if self.pos < 1:
+            raise ValueError(f"Position must be 1-based, got {self.pos}")
+        if not self.ref:
+            raise ValueError(f"Reference allele must not be empty at {self.chrom}:{self.pos}")
+        if self.qual is not None and self.qual < 0:
+            raise ValueError(
+                f"Quality score must be non-negative, got {self.qual} "
+                f"at {self.chrom}:{self.pos}"
+            )
+        return self
+
+
+@dataclass
+class VariantBatch:
+    """
+    Column-oriented (struct-of-arrays) batch of variants.
+
+    Fixed-width columns are NumPy arrays; variable-width string columns are
+    plain lists. Missing QUAL values are stored as NaN. ALT alleles are packed
+    into one comma-separated string per row ("" when there are none), so the
+    common biallelic row holds a single str rather than a tuple of strs.
+    """
+
+    contigs: List[str]  # header contigs first, then any seen only in records
+    chrom_codes: np.ndarray  # int16 (int32 for very large contig tables), index into `contigs`
+    pos: np.ndarray  # int64, 1-based
+    qual: np.ndarray  # float32, NaN when missing
+    ref: List[str]
+    alts: List[str]  # comma-separated
+    id: List[Optional[str]]
+    filter: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.pos)
+
+    def alt_list(self, i: int) -> List[str]:
+        """Unpack the ALT alleles of row `i`."""
+        alts = self.alts[i]
+        return alts.split(",") if alts else []
+
+    def row(self, i: int) -> VariantRecord:
+        """Build a VariantRecord for row `i`."""
+        qual = self.qual[i]
+        return VariantRecord(
+            self.contigs[self.chrom_codes[i]],
+            int(self.pos[i]),
+            self.ref[i],
+            tuple(self.alt_list(i)),
+            self.id[i],
+            None if np.isnan(qual) else float(qual),
+            self.filter[i],
+        )
+
+    def region_mask(
+        self, chrom: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Select rows within a region, evaluated over whole columns at once.
+
+        Args:
+            chrom: Contig name
+            start: Optional 1-based inclusive start position
+            end: Optional 1-based inclusive end position
+
+        Returns:
+            Boolean array, True for rows inside the region
+        """
+        try:
+            code = self.contigs.index(chrom)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+
+        mask = self.chrom_codes == code
+        if start is not None:
+            mask &= self.pos >= start
+        if end is not None:
+            mask &= self.pos <= end
+        return mask
+
+    def select(self, mask: np.ndarray) -> "VariantBatch":
+        """
+        Build a new batch holding only the rows where `mask` is True.
+
+        Args:
+            mask: Boolean array with one entry per row
+
+        Returns:
+            VariantBatch sharing this batch's contig table
+        """
+        rows = np.flatnonzero(mask).tolist()
+        return VariantBatch(
+            contigs=self.contigs,
+            chrom_codes=self.chrom_codes[mask],
+            pos=self.pos[mask],
+            qual=self.qual[mask],
+            ref=[self.ref[i] for i in rows],
+            alts=[self.alts[i] for i in rows],
+            id=[self.id[i] for i in rows],
+            filter=[self.filter[i] for i in rows],
+        )
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """
+        Return the batch as a dict of column arrays keyed by field name.
+
+        Numeric columns are returned as-is; string columns become object
+        arrays, with chrom decoded from the contig codes in one vectorized take.
+        """
+        return {
+            "chrom": np.asarray(self.contigs, dtype=object)[self.chrom_codes],
+            "pos": self.pos,
+            "ref": np.asarray(self.ref, dtype=object),
+            "alts": np.asarray(self.alts, dtype=object),
+            "id": np.asarray(self.id, dtype=object),
+            "qual": self.qual,
+            "filter": np.asarray(self.filter, dtype=object),
+        }
+
+    def to_arrow(self):
+        """
+        Convert the batch to a pyarrow.Table.
+
+        Requires pyarrow, which is only needed by the columnar output stages.
+        """
+        import pyarrow as pa
+
+        return pa.table({
+            # Codes index the contig table directly, so no re-encoding is needed
+            "chrom": pa.DictionaryArray.from_arrays(
+                pa.array(self.chrom_codes), pa.array(self.contigs, type=pa.large_string())
+            ),
+            "pos": pa.array(self.pos),
+            "ref": pa.array(self.ref, type=pa.large_string()),
+            "alts": pa.array(
+                [alts.split(",") if alts else [] for alts in self.alts],
+                type=pa.list_(pa.large_string()),
+            ),
+            "id": pa.array(self.id, type=pa.large_string()),
+            "qual": pa.array(self.qual, mask=np.isnan(self.qual)),
+            "filter": pa.array(self.filter, type=pa.large_string()),
+        })
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, List
+from typing import BinaryIO, Iterable, List, Tuple
 
 
 class StorageHandler(ABC):
@@ -11,13 +11,48 @@ class StorageHandler(ABC):
     """
 
     @abstractmethod
-    def write_file(self, data: bytes, destination: str) -> str:
+    def write_file(self, data: bytes, destination: str, fdatasync: bool = False) -> str:
         """
         Write binary data to storage.
 
         Args:
             data: Binary data to write
             destination: Target path/key in storage
+            fdatasync: Flush data to durable storage before returning, where
+                the backend supports it
+
+        Returns:
+            Full path/URI to the written file
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_many(self, items: Iterable[Tuple[bytes, str]]) -> List[str]:
+        """
+        Write several files, concurrently where the backend allows.
+
+        Prefer this over repeated write_file calls when writing many small
+        files, since per-file overhead (directory creation, remote round
+        trips) is paid in parallel.
+
+        Args:
+            items: (data, destination) pairs
+
+        Returns:
+            Full paths/URIs to the written files, in input order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_file_from_path(self, src_path: str, destination: str, move: bool = False) -> str:
+        """
+        Store an existing local file without reading it into memory.
+
+        Args:
+            src_path: Path to a file on the local filesystem
+            destination: Target path/key in storage
+            move: Allow consuming src_path (e.g. by renaming it) instead of
+                copying; src_path may no longer exist afterwards
 
         Returns:
             Full path/URI to the written file
@@ -53,6 +88,22 @@ class StorageHandler(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def open_for_appending(self, destination: str) -> BinaryIO:
+        """
+        Open a file handle for appending, creating the file if needed.
+
+        Lets writers accumulate output across several calls before it is
+        flushed.
+
+        Args:
+            destination: Target path/key in storage
+
+        Returns:
+            File-like object open for binary appending
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def exists(self, path: str) -> bool:
         """
@@ -67,12 +118,13 @@ class StorageHandler(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_files(self, prefix: str) -> List[str]:
+    def list_files(self, prefix: str, sort: bool = False) -> List[str]:
         """
         List files under a given prefix/directory.
 
         Args:
             prefix: Directory path or prefix to list
+            sort: Return paths in sorted order (otherwise backend order)
 
         Returns:
             List of file paths/keys
@@ -1,16 +1,50 @@
-from typing import BinaryIO, List
+import io
+import os
+import threading
+from typing import BinaryIO, Iterable, List, Tuple
 
 from .base import StorageHandler
 
+# Objects larger than this are uploaded in resumable chunks of this size
+_CHUNK_SIZE = 8 * 1024 * 1024
+# Concurrent uploads in write_many
+_UPLOAD_WORKERS = 16
+# Total time budget for retrying a single request
+_RETRY_DEADLINE = 300.0
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """
+    Return the process-wide GCS client, creating it on first use.
+
+    The client owns the authenticated HTTP session and its connection pool, so
+    sharing one avoids a credential lookup and TLS handshake per handler.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            try:
+                from google.cloud import storage
+            except ImportError as e:
+                raise ImportError(
+                    "GCS storage requires google-cloud-storage "
+                    "(install with: poetry install --with gcs)"
+                ) from e
+            _client = storage.Client()
+        return _client
+
 
 class GCSStorageHandler(StorageHandler):
     """
     Storage handler for Google Cloud Storage.
 
-    This is a stub implementation that will be completed when GCS integration
-    is needed. It will use the google-cloud-storage Python client library.
+    Uses the google-cloud-storage client library, which is an optional
+    dependency. All handlers in a process share one client.
 
-    Example usage (future):
+    Example usage:
         storage = GCSStorageHandler(bucket='my-bucket', prefix='pipeline-output')
         storage.write_file(data, 'run_001/shard_0000.bcf')
     """
@@ -23,42 +57,168 @@ class GCSStorageHandler(StorageHandler):
             bucket: GCS bucket name
             prefix: Optional prefix/folder within bucket
         """
+        self.client = _get_client()
+        from google.cloud.storage.retry import DEFAULT_RETRY
+
         self.bucket = bucket
-        self.prefix = prefix.rstrip('/')
-        # TODO: Initialize GCS client when implemented
-        # from google.cloud import storage
-        # self.client = storage.Client()
-        # self.bucket_obj = self.client.bucket(bucket)
-        raise NotImplementedError(
-            "GCS storage handler not yet implemented. "
-            "Will be added when cloud deployment is needed."
+        self.prefix = prefix.strip('/')
+        self.bucket_obj = self.client.bucket(bucket)
+        # Uploads overwrite whole objects, so retrying them is safe
+        self._retry = DEFAULT_RETRY.with_deadline(_RETRY_DEADLINE)
+
+    def _blob_name(self, path: str) -> str:
+        path = path.lstrip('/')
+        return f"{self.prefix}/{path}" if self.prefix else path
+
+    def _blob(self, path: str):
+        return self.bucket_obj.blob(self._blob_name(path), chunk_size=_CHUNK_SIZE)
+
+    def write_file(self, data: bytes, destination: str, fdatasync: bool = False) -> str:
+        """
+        Upload binary data to a blob.
+
+        Args:
+            data: Binary data to write
+            destination: Blob path relative to the prefix
+            fdatasync: Ignored; a completed upload is already durable
+
+        Returns:
+            gs:// URI of the written blob
+        """
+        self._blob(destination).upload_from_string(data, retry=self._retry)
+        return self.get_uri(destination)
+
+    def write_many(self, items: Iterable[Tuple[bytes, str]]) -> List[str]:
+        """
+        Upload several blobs concurrently using the transfer manager.
+
+        Args:
+            items: (data, destination) pairs, destinations relative to the prefix
+
+        Returns:
+            gs:// URIs of the written blobs, in input order
+        """
+        from google.cloud.storage import transfer_manager
+
+        items = list(items)
+        if not items:
+            return []
+
+        transfer_manager.upload_many(
+            [(io.BytesIO(data), self._blob(dest)) for data, dest in items],
+            upload_kwargs={"retry": self._retry},
+            worker_type=transfer_manager.THREAD,
+            max_workers=_UPLOAD_WORKERS,
+            raise_exception=True,
         )
+        return [self.get_uri(dest) for _, dest in items]
 
-    def write_file(self, data: bytes, destination: str) -> str:
-        """Write to GCS (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+    def write_file_from_path(self, src_path: str, destination: str, move: bool = False) -> str:
+        """
+        Upload a local file, streaming it from disk.
+
+        Args:
+            src_path: Path to an existing local file
+            destination: Blob path relative to the prefix
+            move: Delete src_path after a successful upload
+
+        Returns:
+            gs:// URI of the written blob
+        """
+        self._blob(destination).upload_from_filename(src_path, retry=self._retry)
+        if move:
+            os.unlink(src_path)
+        return self.get_uri(destination)
 
     def read_file(self, source: str) -> bytes:
-        """Read from GCS (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        """
+        Download a blob.
+
+        Args:
+            source: Blob path relative to the prefix
+
+        Returns:
+            Binary contents of the blob
+        """
+        from google.api_core.exceptions import NotFound
+
+        try:
+            return self._blob(source).download_as_bytes()
+        except NotFound:
+            raise FileNotFoundError(f"File not found: {self.get_uri(source)}") from None
 
     def open_for_writing(self, destination: str) -> BinaryIO:
-        """Open GCS blob for writing (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        """
+        Open a blob for streaming writes.
+
+        Data is uploaded in resumable chunks as it is written; the blob is
+        finalized when the handle is closed.
+
+        Args:
+            destination: Blob path relative to the prefix
+
+        Returns:
+            File-like object open for binary writing
+        """
+        return self._blob(destination).open("wb", retry=self._retry)
+
+    def open_for_appending(self, destination: str) -> BinaryIO:
+        """GCS objects are immutable and cannot be appended to."""
+        raise NotImplementedError("GCS objects cannot be appended to; write a new object")
 
     def exists(self, path: str) -> bool:
-        """Check if blob exists in GCS (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        """
+        Check if a blob exists.
+
+        Args:
+            path: Blob path relative to the prefix
+
+        Returns:
+            True if the blob exists, False otherwise
+        """
+        return self._blob(path).exists()
+
+    def list_files(self, prefix: str = "", sort: bool = False) -> List[str]:
+        """
+        List blobs under a given prefix.
+
+        Args:
+            prefix: Path prefix relative to the handler prefix
+            sort: Return paths in sorted order (GCS already lists in
+                lexicographic order)
 
-    def list_files(self, prefix: str) -> List[str]:
-        """List blobs in GCS (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        Returns:
+            List of blob paths relative to the handler prefix
+        """
+        offset = len(self.prefix) + 1 if self.prefix else 0
+        blobs = self.client.list_blobs(self.bucket, prefix=self._blob_name(prefix))
+        files = [blob.name[offset:] for blob in blobs]
+        if sort:
+            files.sort()
+        return files
 
     def delete_file(self, path: str) -> None:
-        """Delete blob from GCS (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        """
+        Delete a blob if it exists.
+
+        Args:
+            path: Blob path relative to the prefix
+        """
+        from google.api_core.exceptions import NotFound
+
+        try:
+            self._blob(path).delete()
+        except NotFound:
+            pass
 
     def get_uri(self, path: str) -> str:
-        """Get GCS URI (not yet implemented)."""
-        raise NotImplementedError("GCS integration pending")
+        """
+        Get the full URI for a blob path.
 
+        Args:
+            path: Blob path relative to the prefix
+
+        Returns:
+            Full gs:// URI
+        """
+        return f"gs://{self.bucket}/{self._blob_name(path)}"
@@ -1,8 +1,43 @@
+import errno
+import mmap
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import BinaryIO, List
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
 
 from .base import StorageHandler
 
+# Buffer size for streamed writes; large enough that shard writers issue few syscalls
+_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _copy_fd(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy all of src into dst, in the kernel where the platform allows."""
+    if hasattr(os, "copy_file_range"):
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        try:
+            while os.copy_file_range(src_fd, dst_fd, _WRITE_BUFFER_SIZE):
+                pass
+            return
+        except OSError as e:
+            # Unsupported by this kernel/filesystem pair; nothing has been written
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+            if os.lseek(dst_fd, 0, os.SEEK_CUR) != 0:
+                raise
+    shutil.copyfileobj(src, dst, _WRITE_BUFFER_SIZE)
+
+
+def _walk_files(directory: str) -> Iterator[str]:
+    """Recursively yield paths of regular files under a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
 
 class LocalStorageHandler(StorageHandler):
     """
@@ -20,36 +55,135 @@ class LocalStorageHandler(StorageHandler):
         """
         self.base_path = Path(base_path).resolve()
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._base_str = str(self.base_path)
+        self._base_prefix = os.path.join(self._base_str, "")
+        # Directories known to exist, so repeated writes skip the mkdir syscalls
+        self._known_dirs = {self._base_str}
 
     def _resolve_path(self, path: str) -> Path:
-        """Resolve a path relative to base_path."""
-        resolved = self.base_path / path
+        """
+        Resolve a path relative to base_path.
+
+        Containment is checked lexically (no filesystem access), so '..' and
+        absolute paths cannot escape base_path. Symlinks are not followed.
+        """
+        combined = os.path.normpath(os.path.join(self._base_str, path))
         # Ensure path is within base_path (security)
-        if not str(resolved.resolve()).startswith(str(self.base_path)):
+        if combined != self._base_str and not combined.startswith(self._base_prefix):
             raise ValueError(f"Path {path} escapes base directory")
-        return resolved
+        return Path(combined)
 
-    def write_file(self, data: bytes, destination: str) -> str:
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory (and parents) the first time it is seen."""
+        directory_str = str(directory)
+        if directory_str not in self._known_dirs:
+            os.makedirs(directory_str, exist_ok=True)
+            self._known_dirs.add(directory_str)
+
+    def write_file(self, data: bytes, destination: str, fdatasync: bool = False) -> str:
         """
         Write binary data to local filesystem.
 
+        The data is written straight to the file descriptor, without passing
+        through a userspace buffer.
+
         Args:
             data: Binary data to write
             destination: Target path relative to base_path
+            fdatasync: Call fdatasync before returning so the data is durable
+
+        Returns:
+            Absolute path to the written file
+        """
+        dest_path = self._resolve_path(destination)
+        self._ensure_dir(dest_path.parent)
+        return self._write_bytes(data, dest_path, fdatasync)
+
+    @staticmethod
+    def _write_bytes(data: bytes, dest_path: Path, fdatasync: bool = False) -> str:
+        """Write data to an already-resolved path whose parent exists."""
+        fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if fdatasync:
+                os.fdatasync(fd)
+        finally:
+            os.close(fd)
+        return str(dest_path)
+
+    def write_many(self, items: Iterable[Tuple[bytes, str]]) -> List[str]:
+        """
+        Write several files concurrently.
+
+        Destination directories are created once up front; the writes then run
+        on a thread pool since they are I/O-bound.
+
+        Args:
+            items: (data, destination) pairs, destinations relative to base_path
+
+        Returns:
+            Absolute paths to the written files, in input order
+        """
+        resolved = [(data, self._resolve_path(dest)) for data, dest in items]
+        if not resolved:
+            return []
+
+        for parent in {dest_path.parent for _, dest_path in resolved}:
+            self._ensure_dir(parent)
+
+        if len(resolved) == 1:
+            data, dest_path = resolved[0]
+            return [self._write_bytes(data, dest_path)]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda item: self._write_bytes(*item), resolved))
+
+    def write_file_from_path(self, src_path: str, destination: str, move: bool = False) -> str:
+        """
+        Copy (or move) a local file into storage without a userspace copy.
+
+        With move=True on the same filesystem the file is renamed atomically.
+        Otherwise the data is copied in the kernel with copy_file_range,
+        falling back to a buffered copy where that is unavailable.
+
+        Args:
+            src_path: Path to an existing local file
+            destination: Target path relative to base_path
+            move: Rename src_path into place when possible; src_path may no
+                longer exist afterwards
 
         Returns:
             Absolute path to the written file
         """
         dest_path = self._resolve_path(destination)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dest_path.parent)
+
+        if move:
+            try:
+                os.replace(src_path, dest_path)
+                return str(dest_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Different filesystem: fall through to a copy
 
-        dest_path.write_bytes(data)
+        with open(src_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            _copy_fd(src, dst)
+
+        if move:
+            os.unlink(src_path)
         return str(dest_path)
 
     def read_file(self, source: str) -> bytes:
         """
         Read binary data from local filesystem.
 
+        This copies the whole file into a new bytes object; see read_file_mmap
+        for large files.
+
         Args:
             source: Path relative to base_path
 
@@ -61,6 +195,34 @@ class LocalStorageHandler(StorageHandler):
             raise FileNotFoundError(f"File not found: {source_path}")
         return source_path.read_bytes()
 
+    def read_file_mmap(self, source: str) -> memoryview:
+        """
+        Map a file into memory read-only, without copying it.
+
+        Prefer this over read_file for large shards: pages are loaded on
+        demand from the page cache and slicing the view does not copy. The
+        mapping stays valid for as long as the returned view is referenced.
+
+        Args:
+            source: Path relative to base_path
+
+        Returns:
+            Read-only memoryview over the file contents
+        """
+        source_path = self._resolve_path(source)
+        try:
+            fd = os.open(source_path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {source_path}") from None
+        try:
+            if os.fstat(fd).st_size == 0:
+                # mmap cannot map an empty file
+                return memoryview(b"")
+            return memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+        finally:
+            # The mapping holds its own reference to the file
+            os.close(fd)
+
     def open_for_writing(self, destination: str) -> BinaryIO:
         """
         Open a file handle for writing.
@@ -72,8 +234,22 @@ class LocalStorageHandler(StorageHandler):
             File handle open for binary writing
         """
         dest_path = self._resolve_path(destination)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        return open(dest_path, 'wb')
+        self._ensure_dir(dest_path.parent)
+        return open(dest_path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+
+    def open_for_appending(self, destination: str) -> BinaryIO:
+        """
+        Open a file handle for appending, creating the file if needed.
+
+        Args:
+            destination: Target path relative to base_path
+
+        Returns:
+            File handle open for binary appending
+        """
+        dest_path = self._resolve_path(destination)
+        self._ensure_dir(dest_path.parent)
+        return open(dest_path, 'ab', buffering=_WRITE_BUFFER_SIZE)
 
     def exists(self, path: str) -> bool:
         """
@@ -87,28 +263,34 @@ class LocalStorageHandler(StorageHandler):
         """
         return self._resolve_path(path).exists()
 
-    def list_files(self, prefix: str = "") -> List[str]:
+    def list_files(self, prefix: str = "", sort: bool = False) -> List[str]:
         """
         List files under a given directory.
 
+        Walks the tree with os.scandir, using the file type cached in each
+        directory entry rather than a stat call per file. Symlinks are not
+        followed.
+
         Args:
             prefix: Directory path relative to base_path
+            sort: Return paths in sorted order (otherwise directory order)
 
         Returns:
             List of file paths relative to base_path
         """
-        prefix_path = self._resolve_path(prefix)
-        if not prefix_path.exists():
-            return []
+        prefix_str = str(self._resolve_path(prefix))
+        # Length of "<base_path>/", sliced off to make paths relative
+        offset = len(self._base_prefix)
 
-        if prefix_path.is_file():
-            return [str(prefix_path.relative_to(self.base_path))]
+        if os.path.isfile(prefix_str):
+            return [prefix_str[offset:]]
+        if not os.path.isdir(prefix_str):
+            return []
 
-        files = []
-        for item in prefix_path.rglob('*'):
-            if item.is_file():
-                files.append(str(item.relative_to(self.base_path)))
-        return sorted(files)
+        files = [path[offset:] for path in _walk_files(prefix_str)]
+        if sort:
+            files.sort()
+        return files
 
     def delete_file(self, path: str) -> None:
         """
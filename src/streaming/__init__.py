@@ -1,13 +1,47 @@
 """VCF Streaming implementations."""
-from .base import VCFStreamer
-from .factory import create_streamer
-from .https import HttpsVCFStreamer
-from .local import LocalVCFStreamer
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports are loaded on first access (PEP 562), so importing this package does
+# not pull in the streamer modules until they are actually used.
+_EXPORTS = {
+    "VCFStreamer": ".base",
+    "LocalVCFStreamer": ".local",
+    "HttpsVCFStreamer": ".https",
+    "CyVCF2Streamer": ".cyvcf2_streamer",
+    "MmapVCFStreamer": ".local_mmap",
+    "create_streamer": ".factory",
+    "create_parallel_streamer": ".parallel",
+}
+
+if TYPE_CHECKING:
+    from .base import VCFStreamer
+    from .cyvcf2_streamer import CyVCF2Streamer
+    from .factory import create_streamer
+    from .https import HttpsVCFStreamer
+    from .local import LocalVCFStreamer
+    from .local_mmap import MmapVCFStreamer
+    from .parallel import create_parallel_streamer
 
 __all__ = [
     "VCFStreamer",
     "LocalVCFStreamer",
     "HttpsVCFStreamer",
+    "CyVCF2Streamer",
+    "MmapVCFStreamer",
     "create_streamer",
+    "create_parallel_streamer",
 ]
 
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,129 @@
+"""Hot loop converting pysam records into column buffers."""
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pysam
+
+# Interned so the overwhelmingly common single-PASS filter shares one object
+_PASS = sys.intern("PASS")
+
+
+def new_filter_cache() -> Dict[object, str]:
+    """Create a FILTER string cache for fill_batch, seeded with PASS."""
+    return {_PASS: _PASS}
+
+
+def fill_batch(
+    records: Iterator[pysam.VariantRecord],
+    n: int,
+    contigs: List[str],
+    contig_codes: Dict[str, int],
+    filter_cache: Dict[object, str],
+    chrom_out: np.ndarray,
+    pos_out: np.ndarray,
+    qual_out: np.ndarray,
+    ref_out: List[str],
+    alts_out: List[str],
+    id_out: List[Optional[str]],
+    filter_out: List[Optional[str]],
+) -> int:
+    """
+    Read up to `n` records from `records` into preallocated column buffers.
+
+    The whole loop runs in one frame with bound-method locals so there is no
+    per-record function call or attribute lookup on the buffers. New contigs
+    are appended to `contigs`/`contig_codes` as they are seen.
+
+    Files use only a handful of distinct FILTER combinations, so each one is
+    joined once and every record shares the cached string object.
+
+    Args:
+        records: Iterator of pysam records
+        n: Maximum number of records to read
+        contigs: Contig table, indexed by code
+        contig_codes: Reverse mapping of contig name to code
+        filter_cache: FILTER string cache from new_filter_cache(), keyed by
+            filter name (single filter) or tuple of names
+        chrom_out: Output array for contig codes
+        pos_out: Output array for positions
+        qual_out: Output array for QUAL (NaN when missing)
+        ref_out: Output list for REF
+        alts_out: Output list for comma-separated ALT alleles
+        id_out: Output list for ID
+        filter_out: Output list for comma-joined FILTER
+
+    Returns:
+        Number of records read; less than `n` only when `records` is exhausted
+
+    Raises:
+        ValueError: If a record has a negative QUAL
+    """
+    get_code = contig_codes.get
+    get_filter = filter_cache.get
+    ref_append = ref_out.append
+    alts_append = alts_out.append
+    id_append = id_out.append
+    filter_append = filter_out.append
+    nan = np.nan
+    join = ",".join
+
+    i = 0
+    for record in records:
+        chrom = record.chrom
+        code = get_code(chrom)
+        if code is None:
+            code = len(contigs)
+            contigs.append(chrom)
+            contig_codes[chrom] = code
+
+        qual = record.qual
+        if qual is not None and qual < 0:
+            raise ValueError(
+                f"Quality score must be non-negative, got {qual} at {chrom}:{record.pos}"
+            )
+
+        filters = record.filter
+        n_filters = len(filters)
+        if n_filters == 1:
+            # A membership test is far cheaper than iterating the filter view
+            key = _PASS if _PASS in filters else next(iter(filters))
+        elif n_filters == 0:
+            key = None
+        else:
+            key = tuple(filters)
+
+        if key is None:
+            filt = None
+        else:
+            filt = get_filter(key)
+            if filt is None:
+                filt = sys.intern(key if n_filters == 1 else join(key))
+                filter_cache[key] = filt
+
+        chrom_out[i] = code
+        pos_out[i] = record.pos
+        qual_out[i] = nan if qual is None else qual
+        # One alleles read decodes REF and ALT together; ref and alts would
+        # each decode them again
+        alleles = record.alleles
+        ref_append(alleles[0])
+        n_alleles = len(alleles)
+        if n_alleles == 2:
+            # Biallelic: keep the allele string itself and let the tuple go
+            alts_append(alleles[1])
+        elif n_alleles == 1:
+            alts_append("")
+        else:
+            alts_append(join(alleles[1:]))
+        id_append(record.id)
+        filter_append(filt)
+
+        i += 1
+        if i == n:
+            break
+    return i
@@ -0,0 +1,89 @@
+"""Read-ahead of records on a background thread."""
+import queue
+import threading
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class _Failure:
+    """Carries an exception raised by the producer over to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class BackgroundIterator(Iterator[T]):
+    """
+    Iterate over `iterable` on a background thread.
+
+    The producer thread hands items over in chunks through a bounded queue, so
+    the per-item queue overhead is amortized and read-ahead is capped at
+    `chunk_size * max_chunks` items. pysam releases the GIL while htslib reads
+    and decompresses, so this overlaps I/O and inflate with the consumer's
+    Python work.
+
+    close() must be called before the underlying file is closed; it stops the
+    producer and waits for it to exit.
+    """
+
+    def __init__(self, iterable: Iterable[T], chunk_size: int = 64, max_chunks: int = 16):
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        self._items = self._consume()
+        self._thread = threading.Thread(
+            target=self._produce,
+            args=(iterable, chunk_size),
+            name="vcf-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop the producer thread and wait for it to finish."""
+        self._stop.set()
+        # Unblock a producer waiting on a full queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, iterable: Iterable[T], chunk_size: int) -> None:
+        try:
+            chunk = []
+            for item in iterable:
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    if not self._put(chunk):
+                        return
+                    chunk = []
+            if chunk and not self._put(chunk):
+                return
+            self._put(_END)
+        except BaseException as e:
+            self._put(_Failure(e))
+
+    def _consume(self) -> Iterator[T]:
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield from item
@@ -1,8 +1,54 @@
+from __future__ import annotations
+
 import functools
+import itertools
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
+
+from src.models import VariantBatch
+
+from ._prefetch import BackgroundIterator
+from .batch import VariantBatchBuilder
+
+if TYPE_CHECKING:
+    import pysam
 
-import pysam
+# htslib BGZF decompression threads used unless the caller asks otherwise: half
+# the CPUs, leaving the rest for Python-side iteration, but at least 2 so
+# decompression always overlaps iteration, and at most 4, beyond which one
+# reader sees no further gain
+DEFAULT_THREADS = max(2, min(4, (os.cpu_count() or 1) // 2))
+
+# A region string ("chr21", "chr21:1000-2000") or a list of them
+Region = Union[str, List[str]]
+
+# "contig", "contig:start" or "contig:start-end", 1-based and inclusive
+_REGION_RE = re.compile(r"^(?P<contig>[^:]+)(?::(?P<start>[\d,]+)(?:-(?P<end>[\d,]+))?)?$")
+
+
+def _parse_region(region: str) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    """
+    Split a region string into contig and 0-based, half-open bounds.
+
+    Args:
+        region: Region string, e.g. 'chr21' or 'chr21:1,000-2,000'
+
+    Returns:
+        (contig, start, end), with start and end None when not given, or None
+        if the string is not in a recognized form (e.g. contig names
+        containing ':')
+    """
+    match = _REGION_RE.match(region)
+    if match is None:
+        return None
+    start, end = match.group("start"), match.group("end")
+    return (
+        match.group("contig"),
+        max(int(start.replace(",", "")) - 1, 0) if start else None,
+        int(end.replace(",", "")) if end else None,
+    )
 
 
 class VCFStreamer(ABC):
@@ -10,10 +56,29 @@ class VCFStreamer(ABC):
     Abstract base class for streaming VCF data.
     """
 
-    def __init__(self, source: str, region: Optional[str] = None):
+    # Streamers are created per region when fanning out, so instances carry
+    # slots rather than a __dict__; subclasses declare their own attributes
+    __slots__ = ("source", "_region", "_region_parsed", "threads", "_vcf_handle", "_prefetcher")
+
+    def __init__(self, source: str, region: Optional[Region] = None, threads: Optional[int] = None):
+        if threads is not None and threads < 1:
+            raise ValueError(f"threads must be at least 1, got: {threads}")
         self.source = source
         self.region = region
+        self.threads = DEFAULT_THREADS if threads is None else threads
         self._vcf_handle = None
+        self._prefetcher = None
+
+    @property
+    def region(self) -> Optional[Region]:
+        return self._region
+
+    @region.setter
+    def region(self, region: Optional[Region]) -> None:
+        self._region = region
+        # Parsed once per region here rather than on each fetch
+        regions = [region] if isinstance(region, str) else region or []
+        self._region_parsed = {r: _parse_region(r) for r in regions}
 
     def __enter__(self):
         self.open()
@@ -26,6 +91,57 @@ class VCFStreamer(ABC):
         if self._vcf_handle is None:
             self.open()
 
+    def _fetch(self, region: str) -> Iterator[pysam.VariantRecord]:
+        """
+        Query the open handle's index for one region.
+
+        The index seeks straight to the first block overlapping the region and
+        the iterator ends at the region's end, so no records outside it are
+        decoded. The region is passed as parsed bounds rather than a string
+        for htslib to parse again.
+        """
+        if region in self._region_parsed:
+            parsed = self._region_parsed[region]
+        else:
+            parsed = _parse_region(region)
+        if parsed is None:
+            return self._vcf_handle.fetch(region=region)
+        return self._vcf_handle.fetch(*parsed)
+
+    def _region_records(self) -> Iterator[pysam.VariantRecord]:
+        """
+        Iterate the open handle over `region`, or the whole file without one.
+
+        A list of regions is fetched in order on the same handle, so the file
+        is opened and its index loaded only once. Regions should not overlap;
+        a record in two regions is yielded twice.
+        """
+        if not self.region:
+            return iter(self._vcf_handle)
+        if isinstance(self.region, str):
+            return self._fetch(self.region)
+        return itertools.chain.from_iterable(map(self._fetch, self.region))
+
+    def _read_ahead(self, records: Iterator[pysam.VariantRecord]) -> Iterator[pysam.VariantRecord]:
+        """
+        Yield `records`, reading them ahead on a background thread.
+
+        Subclasses using this must call _stop_read_ahead() in close() before
+        closing the handle the records come from.
+        """
+        prefetcher = self._prefetcher = BackgroundIterator(records)
+        try:
+            yield from prefetcher
+        finally:
+            prefetcher.close()
+            if self._prefetcher is prefetcher:
+                self._prefetcher = None
+
+    def _stop_read_ahead(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.close()
+            self._prefetcher = None
+
     @staticmethod
     def requires_open(method):
         @functools.wraps(method)
@@ -49,3 +165,34 @@ class VCFStreamer(ABC):
     @abstractmethod
     def get_header(self) -> pysam.VariantHeader:
         raise NotImplementedError
+
+    def stream_batches(self, batch_size: int = 8192) -> Iterator[VariantBatch]:
+        """
+        Stream variants as column-oriented batches.
+
+        Args:
+            batch_size: Maximum number of variants per batch
+
+        Yields:
+            VariantBatch objects holding up to `batch_size` variants
+        """
+        builder = VariantBatchBuilder(batch_size, self.get_header().contigs)
+        records = iter(self.stream())
+        while (batch := builder.next_batch(records)) is not None:
+            yield batch
+
+    @requires_open
+    def iter_region(self, region: str) -> Iterator[pysam.VariantRecord]:
+        """
+        Stream one region on the open handle.
+
+        Repeated calls reuse the handle and its loaded index, so querying many
+        regions costs one open rather than one per region.
+
+        Args:
+            region: Region string, e.g. 'chr21' or 'chr21:1000-2000'
+
+        Returns:
+            Iterator over the records overlapping the region
+        """
+        return self._fetch(region)
@@ -0,0 +1,95 @@
+"""Columnar batching of streamed VCF records."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.models import VariantBatch
+
+from ._convert import fill_batch, new_filter_cache
+
+if TYPE_CHECKING:
+    import pysam
+
+# Largest contig table whose codes still fit in int16
+_INT16_CODES = np.iinfo(np.int16).max + 1
+
+
+class BatchFields(NamedTuple):
+    """
+    The record fields fill_batch reads, with pysam's attribute names.
+
+    Lets readers other than pysam feed VariantBatchBuilder.
+    """
+
+    chrom: str
+    pos: int
+    alleles: Tuple[str, ...]
+    id: Optional[str]
+    qual: Optional[float]
+    filter: Tuple[str, ...]
+
+
+class VariantBatchBuilder:
+    """
+    Build fixed-size VariantBatch objects from an iterator of pysam records.
+
+    Numeric columns are written into preallocated NumPy arrays so each record
+    costs a handful of attribute reads rather than an object instantiation.
+    Chromosomes are stored as int16 codes into a contig table seeded from the
+    header, falling back to int32 only for assemblies with very many contigs.
+    """
+
+    def __init__(self, batch_size: int = 8192, contigs: Optional[Iterable[str]] = None):
+        """
+        Args:
+            batch_size: Maximum number of variants per batch
+            contigs: Contig names from the VCF header, which fix the code order;
+                contigs missing from the header are appended as they are seen
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got: {batch_size}")
+        self.batch_size = batch_size
+        # Contig table is shared by every batch from this builder
+        self._contigs: List[str] = list(contigs or ())
+        self._contig_codes: Dict[str, int] = {
+            name: code for code, name in enumerate(self._contigs)
+        }
+        self._filter_cache = new_filter_cache()
+
+    def next_batch(self, records: Iterator[pysam.VariantRecord]) -> Optional[VariantBatch]:
+        """
+        Read the next batch from `records`.
+
+        Returns:
+            A VariantBatch of up to `batch_size` variants, or None once
+            `records` is exhausted
+        """
+        # A batch adds at most batch_size contigs, so this bound cannot overflow
+        if len(self._contigs) + self.batch_size <= _INT16_CODES:
+            code_dtype = np.int16
+        else:
+            code_dtype = np.int32
+        chrom_codes = np.empty(self.batch_size, dtype=code_dtype)
+        pos = np.empty(self.batch_size, dtype=np.int64)
+        qual = np.empty(self.batch_size, dtype=np.float32)
+        ref, alts, ids, filters = [], [], [], []
+
+        n = fill_batch(
+            records, self.batch_size, self._contigs, self._contig_codes, self._filter_cache,
+            chrom_codes, pos, qual, ref, alts, ids, filters,
+        )
+        if n == 0:
+            return None
+
+        return VariantBatch(
+            contigs=self._contigs,
+            chrom_codes=chrom_codes[:n],
+            pos=pos[:n],
+            qual=qual[:n],
+            ref=ref,
+            alts=alts,
+            id=ids,
+            filter=filters,
+        )
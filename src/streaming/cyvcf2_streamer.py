@@ -0,0 +1,115 @@
+"""cyvcf2-backed VCF streaming implementation."""
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
+
+from src.models import VariantBatch, VariantRecord
+
+from ._convert import new_filter_cache
+from .base import Region, VCFStreamer
+from .batch import BatchFields, VariantBatchBuilder
+
+if TYPE_CHECKING:
+    import cyvcf2
+
+
+class CyVCF2Streamer(VCFStreamer):
+    """
+    Stream VCF data with cyvcf2 instead of pysam.
+
+    cyvcf2 decodes the fixed columns in C and hands back already-typed values,
+    so it costs less per record than iterating pysam records from Python.
+    cyvcf2 is an optional dependency (poetry install --with cyvcf2).
+
+    stream() yields VariantRecord objects rather than pysam records, so this
+    streamer suits consumers of the fixed columns, not the BCF sharder.
+    get_header() returns the raw header text.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, source: str, region: Optional[Region] = None, threads: Optional[int] = None
+    ):
+        if not source.startswith("https://") and not os.path.exists(source):
+            raise FileNotFoundError(f"VCF file not found: {source}")
+        super().__init__(source, region, threads)
+
+    def open(self) -> None:
+        if self._vcf_handle is not None:
+            return
+
+        try:
+            import cyvcf2
+        except ImportError as e:
+            raise ImportError(
+                "CyVCF2Streamer requires cyvcf2 (install with: poetry install --with cyvcf2)"
+            ) from e
+
+        # Only the fixed columns are read, so records are never fully unpacked;
+        # lazy skips decoding INFO and per-sample FORMAT fields
+        self._vcf_handle = cyvcf2.VCF(self.source, lazy=True, threads=self.threads)
+
+    def close(self) -> None:
+        if self._vcf_handle is not None:
+            self._vcf_handle.close()
+            self._vcf_handle = None
+
+    @VCFStreamer.requires_open
+    def get_header(self) -> str:
+        return self._vcf_handle.raw_header
+
+    def _fetch(self, region: str) -> Iterator[cyvcf2.Variant]:
+        # Calling the reader with a region queries the index
+        return self._vcf_handle(region)
+
+    @VCFStreamer.requires_open
+    def stream(self) -> Iterator[VariantRecord]:
+        # Contigs, FILTER combinations and SNV alleles take few distinct values,
+        # so each is built once and shared by every record that uses it
+        chroms: Dict[str, str] = {}
+        filter_cache = new_filter_cache()
+        snv_alts: Dict[str, Tuple[str]] = {}
+
+        # Bound to locals so the loop does no global or attribute lookups on them;
+        # building the tuple directly skips the NamedTuple __new__ frame
+        get_chrom = chroms.get
+        get_filter = filter_cache.get
+        get_snv_alts = snv_alts.get
+        new_record = functools.partial(tuple.__new__, VariantRecord)
+
+        for variant in self._region_records():
+            chrom = variant.CHROM
+            chrom = get_chrom(chrom) or chroms.setdefault(chrom, chrom)
+
+            filters = variant.FILTERS
+            if not filters:
+                filt = None
+            else:
+                key = filters[0] if len(filters) == 1 else tuple(filters)
+                filt = get_filter(key)
+                if filt is None:
+                    filt = filter_cache[key] = key if isinstance(key, str) else ",".join(key)
+
+            alts = variant.ALT
+            if len(alts) == 1 and len(alts[0]) == 1:
+                allele = alts[0]
+                alts = get_snv_alts(allele) or snv_alts.setdefault(allele, (allele,))
+            else:
+                alts = tuple(alts)
+
+            yield new_record(
+                (chrom, variant.POS, variant.REF, alts, variant.ID, variant.QUAL, filt)
+            )
+
+    @VCFStreamer.requires_open
+    def stream_batches(self, batch_size: int = 8192) -> Iterator[VariantBatch]:
+        builder = VariantBatchBuilder(batch_size, self._vcf_handle.seqnames)
+        records = (
+            BatchFields(v.CHROM, v.POS, (v.REF, *v.ALT), v.ID, v.QUAL, v.FILTERS)
+            for v in self._region_records()
+        )
+        while (batch := builder.next_batch(records)) is not None:
+            yield batch
@@ -1,51 +1,83 @@
 """Factory for creating appropriate VCF streamer based on source."""
 
 import logging
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Dict, Optional, Type
 
-from .base import VCFStreamer
+from .base import Region, VCFStreamer
+from .cyvcf2_streamer import CyVCF2Streamer
 from .https import HttpsVCFStreamer
 from .local import LocalVCFStreamer
+from .local_mmap import MmapVCFStreamer
 
 logger = logging.getLogger(__name__)
 
+_FILE_PREFIX = "file://"
 
-def create_streamer(source: str, region: Optional[str] = None) -> VCFStreamer:
+# Source prefix -> streamer class; checked with str.startswith, not urlparse
+_SCHEMES: Dict[str, Type[VCFStreamer]] = {
+    "https://": HttpsVCFStreamer,
+    _FILE_PREFIX: LocalVCFStreamer,
+}
+
+# Record readers other than pysam, which picks the streamer per scheme
+_BACKEND_STREAMERS: Dict[str, Type[VCFStreamer]] = {
+    "cyvcf2": CyVCF2Streamer,
+    "mmap": MmapVCFStreamer,
+}
+
+BACKENDS = ("pysam", *_BACKEND_STREAMERS)
+
+
+def create_streamer(
+    source: str,
+    region: Optional[Region] = None,
+    backend: str = "pysam",
+    threads: Optional[int] = None,
+) -> VCFStreamer:
     """
     Create appropriate VCF streamer based on source URI scheme.
 
     Args:
         source: URI to VCF file (local path or URL)
-        region: Optional genomic region filter
+        region: Optional genomic region filter, or a list of regions
+        backend: Record reader, one of BACKENDS. "cyvcf2" and "mmap" yield
+            VariantRecord objects instead of pysam records; "cyvcf2" requires the
+            cyvcf2 extra and "mmap" reads uncompressed local files only
+        threads: Decompression threads (defaults to half the CPU count, between 2 and 4)
 
     Returns:
         Appropriate VCFStreamer implementation
 
     Raises:
-        ValueError: If source scheme is not supported
+        ValueError: If source scheme or backend is not supported
 
     Examples:
         >>> streamer = create_streamer("/path/to/file.vcf.gz")
         >>> streamer = create_streamer("https://example.com/variants.vcf.gz", region="chr21")
     """
-    parsed = urlparse(source)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend}. Supported backends: {BACKENDS}")
+    backend_cls = _BACKEND_STREAMERS.get(backend)
 
-    # HTTPS URL
-    if parsed.scheme == "https":
-        logger.debug(f"Creating HTTPS streamer for: {source}")
-        return HttpsVCFStreamer(source, region)
+    for prefix, streamer_cls in _SCHEMES.items():
+        if source.startswith(prefix):
+            # Strip file:// so the local streamer gets a plain path
+            path = source[len(_FILE_PREFIX):] if prefix == _FILE_PREFIX else source
+            if backend_cls is not None:
+                streamer_cls = backend_cls
+            logger.debug("Creating %s for: %s", streamer_cls.__name__, path)
+            return streamer_cls(path, region, threads)
 
-    # Local file (no scheme or file:// scheme)
-    if parsed.scheme in ("", "file"):
-        # Remove file:// prefix if present
-        local_path = parsed.path if parsed.scheme == "file" else source
-        logger.debug(f"Creating local file streamer for: {local_path}")
-        return LocalVCFStreamer(local_path, region)
+    # Local file (no scheme)
+    if "://" not in source:
+        streamer_cls = backend_cls or LocalVCFStreamer
+        logger.debug("Creating %s for: %s", streamer_cls.__name__, source)
+        return streamer_cls(source, region, threads)
 
     # Unsupported scheme
-    logger.error(f"Unsupported source scheme: {parsed.scheme}")
+    scheme = source.split("://", 1)[0]
+    logger.error("Unsupported source scheme: %s", scheme)
     raise ValueError(
-        f"Unsupported source scheme: {parsed.scheme}. "
+        f"Unsupported source scheme: {scheme}. "
         f"Supported schemes: file://, https://, or local paths"
     )
@@ -1,9 +1,12 @@
 """HTTPS VCF streaming implementation."""
-from typing import Iterator, Optional
+from __future__ import annotations
 
-import pysam
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from .base import VCFStreamer
+from .base import Region, VCFStreamer
+
+if TYPE_CHECKING:
+    import pysam
 
 
 class HttpsVCFStreamer(VCFStreamer):
@@ -13,12 +16,20 @@ class HttpsVCFStreamer(VCFStreamer):
     Uses pysam/htslib's native HTTP(s) support including range requests for
     indexed VCF/BCF files. Works efficiently even for region queries if the
     remote endpoint supports HTTP range requests.
+
+    Records are read ahead on a background thread, so network reads and BGZF
+    decompression overlap with the consumer's processing. htslib additionally
+    decompresses BGZF blocks on `threads` worker threads.
     """
 
-    def __init__(self, source: str, region: Optional[str] = None):
+    __slots__ = ()
+
+    def __init__(
+        self, source: str, region: Optional[Region] = None, threads: Optional[int] = None
+    ):
         if not source.startswith("https://"):
             raise ValueError(f"Source must be HTTPS URL, got: {source}")
-        super().__init__(source, region)
+        super().__init__(source, region, threads)
 
     def open(self) -> None:
         """Open the remote VCF using pysam's HTTPS streaming support."""
@@ -26,12 +37,17 @@ class HttpsVCFStreamer(VCFStreamer):
             return
 
         try:
-            self._vcf_handle = pysam.VariantFile(self.source)
+            # Imported on first open so importing streamers stays cheap
+            import pysam
+
+            self._vcf_handle = pysam.VariantFile(self.source, threads=self.threads)
         except Exception as e:
             raise IOError(f"Failed to open remote VCF {self.source}: {e}") from e
 
     def close(self) -> None:
         """Close the remote handle if open."""
+        # The read-ahead thread must stop before its handle is closed
+        self._stop_read_ahead()
         if self._vcf_handle is not None:
             self._vcf_handle.close()
             self._vcf_handle = None
@@ -51,13 +67,7 @@ class HttpsVCFStreamer(VCFStreamer):
         """
         try:
             # Region streaming or full streaming
-            iterator = (
-                self._vcf_handle.fetch(region=self.region)
-                if self.region else self._vcf_handle
-            )
-
-            for record in iterator:
-                yield record
+            yield from self._read_ahead(self._region_records())
 
         except Exception as e:
             raise IOError(f"Failed to stream from remote VCF {self.source}: {e}") from e
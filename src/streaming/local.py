@@ -1,30 +1,106 @@
+from __future__ import annotations
+
 import os
-from typing import Iterator, Optional
+import shutil
+import subprocess
+from typing import TYPE_CHECKING, Iterator, List, Optional
+
+from .base import Region, VCFStreamer
+
+if TYPE_CHECKING:
+    import pysam
+
+# External gzip decompressors that can use several cores, in order of preference.
+# Each entry maps an executable to its "decompress to stdout" arguments.
+_PARALLEL_GUNZIP = (
+    ("pugz", lambda threads: ["-t", str(threads)]),
+    ("pigz", lambda threads: ["-d", "-c", "-p", str(threads)]),
+)
 
-import pysam
+# Records are read ahead on a background thread only with a spare CPU: htslib
+# reads and parses them without the GIL, overlapping the consumer, but on one
+# CPU nothing overlaps and the handoff costs ~20%
+_READ_AHEAD = (os.cpu_count() or 1) > 1
 
-from .base import VCFStreamer
+
+def _parallel_gunzip_command(source: str, threads: int) -> Optional[List[str]]:
+    """Return a command decompressing `source` to stdout, if a tool is installed."""
+    for name, args in _PARALLEL_GUNZIP:
+        path = shutil.which(name)
+        if path:
+            return [path, *args(threads), source]
+    return None
 
 
 class LocalVCFStreamer(VCFStreamer):
     """
     Stream VCF data from local filesystem using pysam.
+
+    When more than one CPU is available, records are read ahead on a background
+    thread so htslib's reading and parsing overlaps the consumer's processing.
+    Whole-file streams of gzipped VCF are decompressed by an external
+    multi-threaded decompressor (pugz or pigz) when one is installed, with
+    pysam parsing the decompressed text from a pipe. Region queries and other
+    inputs go through htslib directly, since they need the index, with BGZF
+    blocks decompressed on `threads` htslib worker threads.
     """
 
-    def __init__(self, source: str, region: Optional[str] = None):
+    __slots__ = ("_decompressor",)
+
+    def __init__(
+        self, source: str, region: Optional[Region] = None, threads: Optional[int] = None
+    ):
         if not os.path.exists(source):
             raise FileNotFoundError(f"VCF file not found: {source}")
-        super().__init__(source, region)
+        super().__init__(source, region, threads)
+        self._decompressor = None
 
     def open(self) -> None:
         if self._vcf_handle is not None:
             return
-        self._vcf_handle = pysam.VariantFile(self.source)
+
+        # Imported on first open so importing streamers stays cheap
+        import pysam
+
+        command = None
+        if not self.region and self.source.endswith(".vcf.gz"):
+            command = _parallel_gunzip_command(self.source, self.threads)
+
+        if command is None:
+            self._vcf_handle = pysam.VariantFile(self.source, threads=self.threads)
+            return
+
+        self._decompressor = subprocess.Popen(command, stdout=subprocess.PIPE)
+        try:
+            self._vcf_handle = pysam.VariantFile(self._decompressor.stdout)
+        except Exception:
+            self._stop_decompressor()
+            raise
 
     def close(self) -> None:
+        # The read-ahead thread must stop before its handle is closed
+        self._stop_read_ahead()
         if self._vcf_handle is not None:
             self._vcf_handle.close()
             self._vcf_handle = None
+        self._stop_decompressor()
+
+    def _stop_decompressor(self) -> None:
+        if self._decompressor is None:
+            return
+        self._decompressor.stdout.close()
+        if self._decompressor.poll() is None:
+            self._decompressor.kill()
+        self._decompressor.wait()
+        self._decompressor = None
+
+    def _fetch(self, region: str) -> Iterator[pysam.VariantRecord]:
+        if self._decompressor is not None:
+            raise ValueError(
+                "Region queries need the indexed file, but this streamer was opened "
+                "for a whole-file read; pass a region when creating it"
+            )
+        return super()._fetch(region)
 
     @VCFStreamer.requires_open
     def get_header(self) -> pysam.VariantHeader:
@@ -32,9 +108,12 @@ class LocalVCFStreamer(VCFStreamer):
 
     @VCFStreamer.requires_open
     def stream(self) -> Iterator[pysam.VariantRecord]:
-        iterator = (
-            self._vcf_handle.fetch(region=self.region)
-            if self.region else self._vcf_handle
-        )
-        for record in iterator:
-            yield record
+        records = self._region_records()
+        yield from self._read_ahead(records) if _READ_AHEAD else records
+
+        # A decompressor failing mid-file looks like a clean EOF to the parser
+        if self._decompressor is not None and self._decompressor.wait() != 0:
+            raise IOError(
+                f"Decompression of {self.source} failed "
+                f"(exit code {self._decompressor.returncode})"
+            )
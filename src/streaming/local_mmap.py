@@ -0,0 +1,209 @@
+"""Memory-mapped streaming of uncompressed local VCF files."""
+import functools
+import mmap
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models import VariantBatch, VariantRecord
+
+from .base import Region, VCFStreamer
+from .batch import BatchFields, VariantBatchBuilder
+
+# Inputs that need a decoder, which a memory map cannot stand in for
+_COMPRESSED_SUFFIXES = (".gz", ".bgz", ".bcf")
+
+_CONTIG_RE = re.compile(r"^##contig=<ID=([^,>]+)", re.MULTILINE)
+
+
+def _record_stop(fields: List[bytes]) -> int:
+    """Return the 1-based last position a split record line covers."""
+    stop = int(fields[1]) + len(fields[3]) - 1
+    # Symbolic alleles (e.g. <DEL>) give their extent in INFO END; the eighth
+    # field also holds any sample columns, so only INFO is searched
+    if len(fields) == 8 and b"END=" in fields[7]:
+        for item in fields[7].split(b"\t", 1)[0].split(b";"):
+            if item.startswith(b"END="):
+                stop = max(stop, int(item[4:]))
+                break
+    return stop
+
+
+def _split_line(line: bytes) -> List[bytes]:
+    fields = line.split(b"\t", 7)
+    if len(fields) == 7:
+        fields[6] = fields[6].rstrip(b"\r\n")
+    return fields
+
+
+class MmapVCFStreamer(VCFStreamer):
+    """
+    Stream an uncompressed local VCF through a read-only memory map.
+
+    Lines are found and split on tabs by bytes methods that scan in C, and only
+    the fixed columns are decoded; INFO and sample columns are not parsed. For
+    plain-text input this skips htslib's full record parse.
+
+    Like CyVCF2Streamer, stream() yields VariantRecord objects and get_header()
+    returns the raw header text. There is no index, so regions are applied by
+    scanning the whole file and keeping records that overlap one, as an index
+    query does: a record spans its REF allele, or up to INFO END when set.
+    """
+
+    __slots__ = ("_file", "_header", "_body_start")
+
+    def __init__(
+        self, source: str, region: Optional[Region] = None, threads: Optional[int] = None
+    ):
+        if source.endswith(_COMPRESSED_SUFFIXES):
+            raise ValueError(f"MmapVCFStreamer reads uncompressed VCF files only, got: {source}")
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"VCF file not found: {source}")
+        super().__init__(source, region, threads)
+        self._file = None
+        self._header = ""
+        self._body_start = 0
+
+    def open(self) -> None:
+        if self._vcf_handle is not None:
+            return
+
+        self._file = open(self.source, "rb")
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise ValueError(f"VCF file is empty: {self.source}")
+            self._vcf_handle = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            self._file = None
+            raise
+
+        # The header is the run of '#' lines at the top of the file
+        handle = self._vcf_handle
+        header = bytearray()
+        while True:
+            start = handle.tell()
+            line = handle.readline()
+            if not line.startswith(b"#"):
+                break
+            header += line
+        self._header = header.decode()
+        self._body_start = start
+
+    def close(self) -> None:
+        if self._vcf_handle is not None:
+            self._vcf_handle.close()
+            self._vcf_handle = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @VCFStreamer.requires_open
+    def get_header(self) -> str:
+        return self._header
+
+    def _body_lines(self) -> Iterator[List[bytes]]:
+        """
+        Yield the columns of each record line, filtered to `region`.
+
+        Lines are split at the first seven tabs only, so INFO and any sample
+        columns stay together, unsplit, in the eighth field. FILTER is the last
+        field when INFO is missing, so a line ending is stripped from it.
+        """
+        handle = self._vcf_handle
+        handle.seek(self._body_start)
+        lines = (
+            _split_line(line) for line in iter(handle.readline, b"") if not line.isspace()
+        )
+
+        if not self.region:
+            yield from lines
+            return
+
+        regions: Dict[bytes, List[Tuple[Optional[int], Optional[int]]]] = {}
+        for region, parsed in self._region_parsed.items():
+            if parsed is None:
+                raise ValueError(f"Unrecognized region: {region}")
+            contig, start, end = parsed
+            regions.setdefault(contig.encode(), []).append((start, end))
+
+        for fields in lines:
+            bounds = regions.get(fields[0])
+            if bounds is None:
+                continue
+            pos = int(fields[1])
+            for start, end in bounds:
+                # start is 0-based, so a record overlaps once it reaches start + 1
+                if (end is None or pos <= end) and (
+                    start is None or pos > start or _record_stop(fields) > start
+                ):
+                    yield fields
+                    break
+
+    @VCFStreamer.requires_open
+    def stream(self) -> Iterator[VariantRecord]:
+        # Contigs, FILTER values and SNV alleles take few distinct values, so
+        # each is decoded once and shared by every record that uses it
+        chroms: Dict[bytes, str] = {}
+        filters: Dict[bytes, Optional[str]] = {b".": None}
+        snv_alts: Dict[bytes, Tuple[str, ...]] = {b".": ()}
+        get_chrom = chroms.get
+        get_snv_alts = snv_alts.get
+        new_record = functools.partial(tuple.__new__, VariantRecord)
+
+        for chrom, pos, vid, ref, alt, qual, filt, *_ in self._body_lines():
+            chrom_str = get_chrom(chrom)
+            if chrom_str is None:
+                chrom_str = chroms[chrom] = chrom.decode()
+
+            try:
+                filter_str = filters[filt]
+            except KeyError:
+                filter_str = filters[filt] = filt.decode().replace(";", ",")
+
+            alts = get_snv_alts(alt)
+            if alts is None:
+                alts = tuple(alt.decode().split(","))
+                if len(alt) == 1:
+                    snv_alts[alt] = alts
+
+            yield new_record((
+                chrom_str,
+                int(pos),
+                ref.decode(),
+                alts,
+                None if vid == b"." else vid.decode(),
+                None if qual == b"." else float(qual),
+                filter_str,
+            ))
+
+    @VCFStreamer.requires_open
+    def stream_batches(self, batch_size: int = 8192) -> Iterator[VariantBatch]:
+        builder = VariantBatchBuilder(batch_size, _CONTIG_RE.findall(self._header))
+        records = self._batch_fields()
+        while (batch := builder.next_batch(records)) is not None:
+            yield batch
+
+    def _batch_fields(self) -> Iterator[BatchFields]:
+        """Yield the fixed columns of each record in the shape fill_batch reads."""
+        chroms: Dict[bytes, str] = {}
+        filters: Dict[bytes, Tuple[str, ...]] = {b".": ()}
+
+        for chrom, pos, vid, ref, alt, qual, filt, *_ in self._body_lines():
+            chrom_str = chroms.get(chrom)
+            if chrom_str is None:
+                chrom_str = chroms[chrom] = chrom.decode()
+
+            filter_names = filters.get(filt)
+            if filter_names is None:
+                filter_names = filters[filt] = tuple(filt.decode().split(";"))
+
+            ref_str = ref.decode()
+            yield BatchFields(
+                chrom_str,
+                int(pos),
+                (ref_str,) if alt == b"." else (ref_str, *alt.decode().split(",")),
+                None if vid == b"." else vid.decode(),
+                None if qual == b"." else float(qual),
+                filter_names,
+            )
@@ -0,0 +1,96 @@
+"""Parallel streaming of several regions of one VCF."""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from queue import Full
+from typing import Iterator, List, Optional
+
+from src.models import VariantRecord
+
+from .factory import BACKENDS, create_streamer
+
+# Records per batch handed from a worker to the consumer
+_BATCH_SIZE = 4096
+# Batches a worker may read ahead of the consumer, per region
+_MAX_QUEUED_BATCHES = 8
+
+
+def create_parallel_streamer(
+    source: str,
+    regions: List[str],
+    workers: Optional[int] = None,
+    backend: str = "pysam",
+) -> Iterator[VariantRecord]:
+    """
+    Stream several regions of a VCF at once, one worker process per region.
+
+    Each worker opens its own streamer on the source, so regions are read and
+    decompressed in parallel. Workers send column batches through a bounded
+    queue per region; records are yielded in region order, with later regions
+    read ahead while earlier ones are consumed.
+
+    Args:
+        source: URI to an indexed VCF/BCF file (local path or URL)
+        regions: Region strings, e.g. ['chr21', 'chr22:1000-2000']
+        workers: Worker processes (defaults to the CPU count, at most one per region)
+        backend: Record reader, one of BACKENDS
+
+    Yields:
+        VariantRecord objects
+
+    Raises:
+        ValueError: If backend is not supported
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unsupported backend: {backend}. Supported backends: {BACKENDS}")
+    if not regions:
+        return
+    workers = min(workers or os.cpu_count() or 1, len(regions))
+
+    # Not fork: the caller may be running threads (e.g. a read-ahead thread)
+    context = multiprocessing.get_context("spawn")
+    manager = context.Manager()
+    stop = manager.Event()
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    try:
+        queues = [manager.Queue(maxsize=_MAX_QUEUED_BATCHES) for _ in regions]
+        # Tasks start in submission order, so the region being consumed is
+        # always running and the bounded queues cannot deadlock
+        futures = [
+            executor.submit(_stream_region, source, region, backend, queue, stop)
+            for region, queue in zip(regions, queues, strict=True)
+        ]
+        for future, queue in zip(futures, queues, strict=True):
+            while (batch := queue.get()) is not None:
+                for i in range(len(batch)):
+                    yield batch.row(i)
+            # Re-raise a failure in the worker
+            future.result()
+    finally:
+        # Stops workers early when the consumer does not read every record
+        stop.set()
+        executor.shutdown(cancel_futures=True)
+        manager.shutdown()
+
+
+def _stream_region(source: str, region: str, backend: str, queue, stop) -> None:
+    """Stream one region in a worker process, putting column batches on `queue`."""
+    try:
+        # One thread per worker; parallelism comes from the workers themselves
+        with create_streamer(source, region, backend=backend, threads=1) as streamer:
+            for batch in streamer.stream_batches(_BATCH_SIZE):
+                if not _put(queue, batch, stop):
+                    return
+    finally:
+        _put(queue, None, stop)
+
+
+def _put(queue, item, stop) -> bool:
+    """Put `item` on `queue`, giving up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
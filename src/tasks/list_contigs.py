@@ -0,0 +1,51 @@
+"""Task for listing the contigs of an indexed VCF, used to fan out sharding."""
+import json
+import logging
+from typing import List
+
+import pysam
+
+logger = logging.getLogger(__name__)
+
+
+def list_contigs_task(source: str) -> List[str]:
+    """
+    List the contigs that have records in an indexed VCF/BCF.
+
+    Contigs are read from the .tbi/.csi index, so only contigs that actually
+    contain variants are returned. If the file has no index, all contigs
+    declared in the header are returned instead.
+
+    Args:
+        source: Path or URL to VCF/BCF file
+
+    Returns:
+        Contig names in index (file) order
+    """
+    with pysam.VariantFile(source) as vcf:
+        if vcf.index is not None:
+            contigs = list(vcf.index.keys())
+        else:
+            logger.warning(f"No index found for {source}; using header contigs")
+            contigs = list(vcf.header.contigs)
+
+    logger.info(f"Found {len(contigs)} contigs in {source}")
+    return contigs
+
+
+if __name__ == "__main__":
+    """Allow running task directly for testing."""
+    import argparse
+
+    # Configure logging for standalone execution
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description="List contigs of an indexed VCF file")
+    parser.add_argument("source", help="Path or URL to VCF file")
+
+    args = parser.parse_args()
+
+    print(json.dumps(list_contigs_task(args.source)))
@@ -1,29 +1,69 @@
 """Task for sharding VCF data into BCF files."""
+import contextlib
+import functools
+import gzip
+import itertools
 import logging
-import subprocess
+import multiprocessing
+import operator
+import os
 import tempfile
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Callable, Iterator, List, Optional, Set, Tuple, Union
 
 import pysam
 
 from src.storage import create_storage
-from src.streaming import create_streamer
+from src.storage.base import StorageHandler
+from src.streaming import LocalVCFStreamer, create_streamer
+from src.streaming.base import Region
 
 logger = logging.getLogger(__name__)
 
+# Filename suffix, pysam write mode and tabix index preset of each shard format
+_SHARD_FORMATS = {
+    "bcf": (".bcf", "wb", "bcf"),
+    "vcfgz": (".vcf.gz", "wz", "vcf"),
+}
+
+# Supported shard output formats
+SHARD_FORMATS = tuple(_SHARD_FORMATS)
+
+# Local VCF text inputs that can be split into shards line by line
+_TEXT_VCF_SUFFIXES = (".vcf", ".vcf.gz", ".vcf.bgz")
+
+# Concurrent shard uploads to storage
+_UPLOAD_WORKERS = 4
+
+# Most shard-writing workers used by default. Each is a spawned interpreter
+# with pysam loaded that holds up to one shard of VCF text, so the default
+# stays bounded on large hosts
+_DEFAULT_WORKERS = 4
+
 
 def shard_vcf_task(
     source: str,
     lines_per_shard: int = 10000,
-    region: Optional[str] = None,
+    region: Optional[Region] = None,
     storage_type: str = "local",
     storage_base_path: str = "/data",
     run_id: Optional[str] = None,
+    shard_prefix: str = "shard",
+    shard_format: str = "bcf",
+    threads: Optional[int] = None,
+    workers: Optional[int] = None,
 ) -> List[str]:
     """
-    Stream VCF data and write it as sharded, compressed, and indexed BCF files.
+    Stream VCF data and write it as sharded, compressed, and indexed BCF or VCF files.
 
     Each shard contains:
     - The full original VCF header
@@ -31,14 +71,36 @@ def shard_vcf_task(
     - CSI index for random access
 
     Shards are written to timestamped run directories for idempotency.
+    Shards are compressed and indexed by a pool of worker processes, so several
+    are written at once while the next shard's records are read. Finished
+    shards are uploaded from a thread pool, so uploads overlap the workers'
+    compression of later shards.
+    Whole-file shards of a local text VCF are split on line boundaries without
+    parsing the records; the workers parse each shard once when encoding it as
+    BCF, and VCF shards are never parsed.
+    Records from a BCF source are written to shard files as they are read.
 
     Args:
         source: Path or URL to source VCF file
         lines_per_shard: Maximum number of variant records per shard
-        region: Optional genomic region to filter
+        region: Optional genomic region to filter, or a list of regions; a list
+            is read in order through one open file and index
         storage_type: Type of storage backend ('local' or 'gcs')
         storage_base_path: Base path for local storage
         run_id: Optional run identifier (defaults to timestamp)
+        shard_prefix: Shard filename prefix; parallel tasks writing to the same
+            run directory (e.g. one per contig) must use distinct prefixes
+        shard_format: Shard output format; 'bcf' (binary, BGZF-compressed) or
+            'vcfgz' (BGZF-compressed VCF text, which skips BCF encoding)
+        threads: htslib threads for BGZF decompression of the source and
+            compression of each shard (defaults to half the CPU count, between 2
+            and 4); workers only use them when there is a single worker
+        workers: Shard-writing worker processes, which is also the most shards
+            held in memory at once (defaults to the CPU count, at most 4). With
+            more than one, shards are parallel and each is encoded
+            single-threaded. The parent keeps `threads` htslib threads, a
+            read-ahead thread and upload threads alongside the workers, so size
+            workers and threads together to the CPUs and memory available
 
     Returns:
         List of shard file paths (relative to storage base)
@@ -53,6 +115,12 @@ def shard_vcf_task(
         ['2025-11-23_10-30-00/shards/shard_0000.bcf',
          '2025-11-23_10-30-00/shards/shard_0001.bcf']
     """
+    if shard_format not in SHARD_FORMATS:
+        raise ValueError(
+            f"Unsupported shard format: {shard_format}. "
+            f"Supported formats: {', '.join(SHARD_FORMATS)}"
+        )
+
     # Generate run ID if not provided (timestamp-based)
     if run_id is None:
         run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -60,59 +128,83 @@ def shard_vcf_task(
     logger.info("Starting VCF sharding task")
     logger.info(f"  Source: {source}")
     logger.info(f"  Lines per shard: {lines_per_shard}")
-    logger.info(f"  Region: {region or 'all'}")
+    regions = [region] if isinstance(region, str) else region
+    logger.info(f"  Region: {', '.join(regions) if regions else 'all'}")
     logger.info(f"  Run ID: {run_id}")
     logger.info(f"  Storage: {storage_type}")
+    logger.info(f"  Shard format: {shard_format}")
 
-    # Initialize storage handler and streamer
     storage = create_storage(storage_type=storage_type, base_path=storage_base_path)
-    streamer = create_streamer(source, region)
+    workers = workers or min(_DEFAULT_WORKERS, os.cpu_count() or 1)
+    streamer = create_streamer(source, region, threads=threads)
+
+    split_lines = (
+        not region
+        and isinstance(streamer, LocalVCFStreamer)
+        and streamer.source.endswith(_TEXT_VCF_SUFFIXES)
+    )
+    # BCF records are already encoded under a header declaring every tag, so
+    # they are written straight to shard files as they stream
+    direct_bcf = streamer.source.endswith(".bcf")
+
+    in_flight: Set[Future] = set()
+    # One level of parallelism: across shards, or within the one worker
+    shard_threads = streamer.threads if workers == 1 else 1
 
     try:
-        # Get header
-        header = streamer.get_header()
-        logger.info(f"VCF version: {header.version}")
-        logger.info(f"Samples: {len(header.samples)}")
-        logger.info(f"Contigs: {len(header.contigs)}")
-
-        shard_paths = []
-        shard_index = 0
-        variant_count = 0
-        buffer = []
-
-        # Stream the body of the VCF file
-        with streamer:
-            for record in streamer.stream():
-                buffer.append(record)
-                variant_count += 1
-
-                # Write shard when buffer reaches limit
-                if len(buffer) >= lines_per_shard:
-                    shard_path = _write_shard(
-                        header=header,
-                        records=buffer,
-                        shard_index=shard_index,
-                        run_id=run_id,
-                        storage=storage,
-                    )
-                    shard_paths.append(shard_path)
-                    logger.info(f"Wrote shard {shard_index}: {len(buffer)} variants")
-
-                    # Reset buffer and increment index
-                    buffer = []
-                    shard_index += 1
-
-            # Write final shard if buffer has remaining records
-            if buffer:
-                shard_path = _write_shard(
-                    header=header,
-                    records=buffer,
-                    shard_index=shard_index,
-                    run_id=run_id,
-                    storage=storage,
+        # Exit order matters: uploads finish before the workers shut down and
+        # the files they read are deleted, and the inputs close last
+        with (
+            contextlib.ExitStack() as inputs,
+            tempfile.TemporaryDirectory() as tmpdir,
+            ProcessPoolExecutor(
+                max_workers=workers,
+                # Not fork: the parent may be running pysam's read-ahead thread
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor,
+            ThreadPoolExecutor(
+                max_workers=_UPLOAD_WORKERS, thread_name_prefix="shard-upload"
+            ) as uploads,
+        ):
+            submit = functools.partial(
+                _submit_bounded, executor, uploads, storage, in_flight, workers
+            )
+            # Per-chromosome counts are gathered in the sharding pass itself,
+            # rather than by streaming the source a second time
+            chrom_counts: Counter = Counter()
+            if split_lines:
+                # The lines are read straight from the file and the streamer is
+                # never opened; for .vcf.gz, opening it would start a
+                # decompressor that nothing reads from
+                header, lines = _split_header(
+                    inputs.enter_context(_open_text_vcf(streamer.source))
                 )
-                shard_paths.append(shard_path)
-                logger.info(f"Wrote shard {shard_index}: {len(buffer)} variants")
+                _log_header(header.decode())
+            else:
+                inputs.enter_context(streamer)
+                header = streamer.get_header()
+                _log_header(str(header))
+
+            if direct_bcf:
+                shards = _shard_bcf_records(
+                    streamer, header, lines_per_shard, submit, Path(tmpdir), run_id,
+                    shard_prefix, shard_format, chrom_counts,
+                )
+            else:
+                if not split_lines:
+                    # pysam records cannot be pickled; ship VCF text to the workers
+                    lines = (str(record).encode() for record in streamer.stream())
+                shards = _shard_text(
+                    header, lines, lines_per_shard, submit, Path(tmpdir), run_id,
+                    shard_prefix, shard_format, shard_threads, chrom_counts,
+                )
+
+            shard_paths = []
+            variant_count = 0
+            for shard_index, (future, count) in enumerate(shards):
+                shard_paths.append(future.result())
+                variant_count += count
+                logger.info(f"Wrote shard {shard_index}: {count} variants")
 
         # Log summary
         logger.info("=" * 60)
@@ -120,6 +212,9 @@ def shard_vcf_task(
         logger.info(f"  Total variants: {variant_count:,}")
         logger.info(f"  Total shards: {len(shard_paths)}")
         logger.info(f"  Output directory: {run_id}/shards/")
+        logger.info("  Per-chromosome breakdown:")
+        for chrom in sorted(chrom_counts):
+            logger.info(f"    {chrom}: {chrom_counts[chrom]:,} variants")
         logger.info("=" * 60)
 
         return shard_paths
@@ -129,74 +224,292 @@ def shard_vcf_task(
         raise
 
 
-def _write_shard(
+def _shard_text(
+    header: Union[bytes, pysam.VariantHeader],
+    lines: Iterator[bytes],
+    lines_per_shard: int,
+    submit: Callable[..., Future],
+    tmpdir: Path,
+    run_id: str,
+    shard_prefix: str,
+    shard_format: str,
+    shard_threads: int,
+    chrom_counts: Counter,
+) -> List[Tuple[Future, int]]:
+    """
+    Cut record lines into shards of VCF text and submit each to _write_shard.
+
+    `header` is either the raw header text the lines were split from, or the
+    parsed header of the streamer producing them. Records are counted per
+    chromosome into `chrom_counts`.
+
+    Returns:
+        (future, variant count) per shard, in shard order
+    """
+    shards: List[Tuple[Future, int]] = []
+    # Keyed by the raw CHROM bytes, decoded once at the end
+    line_counts: Counter = Counter()
+
+    def submit_shard(records: bytes, count: int) -> None:
+        # The last line of a file may lack its newline
+        if not records.endswith(b"\n"):
+            records += b"\n"
+        # A parsed header is read now, so it declares every tag the shard's
+        # records use, including ones htslib added while parsing them
+        header_text = header if isinstance(header, bytes) else str(header).encode()
+        shard_index = len(shards)
+        shard_filename = _shard_filename(shard_prefix, shard_index, shard_format)
+        future = submit(
+            f"{run_id}/shards/{shard_filename}",
+            _write_shard,
+            header_text,
+            records,
+            str(tmpdir / shard_filename),
+            shard_format,
+            shard_threads,
+        )
+        shards.append((future, count))
+
+    # Take the body a shard at a time; islice does the counting, and the
+    # shard's records are joined into one flat block of VCF text
+    while chunk := list(itertools.islice(lines, lines_per_shard)):
+        line_counts.update(line[:line.find(b"\t")] for line in chunk)
+        submit_shard(b"".join(chunk), len(chunk))
+
+    for chrom, count in line_counts.items():
+        chrom_counts[chrom.decode()] += count
+    return shards
+
+
+def _shard_bcf_records(
+    streamer,
     header: pysam.VariantHeader,
-    records: List[pysam.VariantRecord],
-    shard_index: int,
+    lines_per_shard: int,
+    submit: Callable[..., Future],
+    tmpdir: Path,
     run_id: str,
-    storage,
-) -> str:
+    shard_prefix: str,
+    shard_format: str,
+    chrom_counts: Counter,
+) -> List[Tuple[Future, int]]:
+    """
+    Write records from a BCF source straight into shard files.
+
+    Records are written from their in-memory encoding, with no VCF text in
+    between; BCF shards keep the encoding they were read in. Finished shard
+    files are submitted to _index_shard for indexing and upload. Records are
+    counted per chromosome into `chrom_counts`.
+
+    Returns:
+        (future, variant count) per shard, in shard order
     """
-    Write a single shard as a compressed and indexed BCF file.
+    shards: List[Tuple[Future, int]] = []
+    _, write_mode, _ = _SHARD_FORMATS[shard_format]
+
+    records = streamer.stream()
+    # A shard's records are buffered in one list sized by islice, so counting
+    # them is a single C-level pass rather than a per-record update
+    while chunk := list(itertools.islice(records, lines_per_shard)):
+        shard_index = len(shards)
+        shard_filename = _shard_filename(shard_prefix, shard_index, shard_format)
+        tmp_shard = str(tmpdir / shard_filename)
+        with pysam.VariantFile(
+            tmp_shard, write_mode, header=header, threads=streamer.threads
+        ) as shard_out:
+            for record in chunk:
+                shard_out.write(record)
+
+        chrom_counts.update(map(operator.attrgetter("chrom"), chunk))
+        future = submit(
+            f"{run_id}/shards/{shard_filename}", _index_shard, tmp_shard, shard_format
+        )
+        shards.append((future, len(chunk)))
+
+    return shards
+
+
+def _log_header(header_text: str) -> None:
+    """Log the VCF version, sample count and contig count of a header."""
+    lines = header_text.splitlines()
+    version = next(
+        (line.split("=", 1)[1] for line in lines if line.startswith("##fileformat=")),
+        "unknown",
+    )
+    columns = lines[-1].split("\t") if lines and lines[-1].startswith("#CHROM") else []
+    logger.info(f"VCF version: {version}")
+    # Sample columns follow the eight fixed columns and FORMAT
+    logger.info(f"Samples: {max(len(columns) - 9, 0)}")
+    logger.info(f"Contigs: {sum(line.startswith('##contig=') for line in lines)}")
+
+
+def _open_text_vcf(path: str) -> BinaryIO:
+    """Open a plain or gzip/BGZF-compressed VCF for reading raw lines."""
+    if path.endswith(".vcf"):
+        return open(path, "rb")
+    # gzip reads BGZF as a series of gzip members; pysam.BGZFile would strip
+    # line endings
+    return gzip.open(path, "rb")
+
+
+def _split_header(lines: Iterator[bytes]) -> Tuple[bytes, Iterator[bytes]]:
+    """
+    Read the header from an iterator of VCF lines.
+
+    Returns:
+        Header text, and an iterator over the remaining (record) lines
+    """
+    header = bytearray()
+    lines = iter(lines)
+    for line in lines:
+        if not line.startswith(b"#"):
+            return bytes(header), itertools.chain((line,), lines)
+        header += line
+    return bytes(header), iter(())
+
+
+def _submit_bounded(
+    executor: ProcessPoolExecutor,
+    uploads: ThreadPoolExecutor,
+    storage: StorageHandler,
+    in_flight: Set[Future],
+    limit: int,
+    shard_path: str,
+    fn: Callable[..., str],
+    *args,
+) -> Future:
+    """
+    Submit `fn(*args)` to `executor` and the upload of its result to `uploads`.
+
+    First waits until fewer than `limit` shards are in flight, counting a shard
+    until it is uploaded. Bounding in-flight shards caps memory at about
+    `limit` shards of VCF text, and a failed shard is re-raised here rather
+    than after the whole source has been read.
+
+    Returns:
+        Future of the upload, resolving to `shard_path`
+    """
+    while len(in_flight) >= limit:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        in_flight -= done
+        for future in done:
+            future.result()
+    written = executor.submit(fn, *args)
+    future = uploads.submit(_upload_shard, storage, written, shard_path)
+    in_flight.add(future)
+    return future
+
+
+def _upload_shard(storage: StorageHandler, written: Future, shard_path: str) -> str:
+    """
+    Move a shard file and its index into storage once its worker has finished.
+
+    Runs on an upload thread. Local storage renames the files into place when
+    on the same filesystem; other backends stream them from disk.
 
     Args:
-        header: VCF header to include in shard
-        records: Variant records to write
-        shard_index: Zero-padded shard number
-        run_id: Run identifier for output directory
-        storage: StorageHandler instance
+        storage: Storage handler to write through
+        written: Future of the worker writing the shard, resolving to its path
+        shard_path: Destination path relative to the storage base
 
     Returns:
-        Relative path to the written BCF file
+        shard_path
     """
-    # Format shard filename with zero-padding (up to 9999 shards)
-    shard_filename = f"shard_{shard_index:04d}.bcf"
-    shard_path = f"{run_id}/shards/{shard_filename}"
+    tmp_shard = written.result()
+    storage.write_file_from_path(tmp_shard, shard_path, move=True)
+    storage.write_file_from_path(f"{tmp_shard}.csi", f"{shard_path}.csi", move=True)
+    return shard_path
 
-    # Use temporary file for writing since pysam and bcftools need real file paths
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_bcf = Path(tmpdir) / shard_filename
 
-        # First write as VCF to avoid header validation issues with BCF
-        tmp_vcf = tmp_bcf.with_suffix('.vcf.gz')
-        with pysam.VariantFile(str(tmp_vcf), 'wz', header=header) as vcf_out:
-            for record in records:
-                vcf_out.write(record)
+def _write_shard(
+    header_text: bytes,
+    records_text: bytes,
+    tmp_shard: str,
+    shard_format: str = "bcf",
+    threads: int = 1,
+) -> str:
+    """
+    Write a single shard as a compressed and indexed file.
 
-        # Convert VCF to BCF using bcftools (ensures proper BCF formatting)
-        try:
-            subprocess.run(
-                ['bcftools', 'view', '-O', 'b', '-o', str(tmp_bcf), str(tmp_vcf)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to convert VCF to BCF: {e.stderr}")
-            raise RuntimeError(f"BCF conversion failed: {e.stderr}") from e
+    Runs in a worker process; the parent uploads the finished files.
 
-        # Index the BCF file using bcftools (CSI index)
-        # CSI index supports larger chromosomes than tabix
+    Args:
+        header_text: Encoded VCF header text to include in shard
+        records_text: Variant records as encoded VCF text lines
+        tmp_shard: Local path to write the shard file to
+        shard_format: Shard output format, one of SHARD_FORMATS
+        threads: htslib threads for BGZF compression of BCF shards
+
+    Returns:
+        tmp_shard
+    """
+    if shard_format == "vcfgz":
+        # The records are already VCF text; compress them without parsing
+        with pysam.BGZFile(tmp_shard, "wb") as shard_out:
+            shard_out.write(header_text)
+            shard_out.write(records_text)
+        return _index_shard(tmp_shard, shard_format)
+
+    # htslib needs a real file to parse the VCF text from
+    tmp_vcf = Path(tmp_shard).with_suffix(".vcf")
+    try:
+        _write_text_vcf(tmp_vcf, header_text, records_text)
         try:
-            subprocess.run(
-                ['bcftools', 'index', '--csi', str(tmp_bcf)],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to index BCF: {e.stderr}")
-            raise RuntimeError(f"BCF indexing failed: {e.stderr}") from e
+            _convert_to_bcf(tmp_vcf, tmp_shard, threads)
+        except OSError:
+            # htslib declares a tag missing from the header when it first parses
+            # it, but refuses to BCF-encode the record that introduced it. Raw
+            # lines split from the source can hit this; parse once to complete
+            # the header, then convert again under it.
+            with pysam.VariantFile(str(tmp_vcf)) as vcf_in:
+                for _ in vcf_in:
+                    pass
+                header_text = str(vcf_in.header).encode()
+            _write_text_vcf(tmp_vcf, header_text, records_text)
+            _convert_to_bcf(tmp_vcf, tmp_shard, threads)
+    finally:
+        tmp_vcf.unlink(missing_ok=True)
+
+    return _index_shard(tmp_shard, shard_format)
+
+
+def _index_shard(tmp_shard: str, shard_format: str = "bcf") -> str:
+    """
+    Build the CSI index of a finished shard file.
 
-        # Read BCF and index files
-        bcf_data = tmp_bcf.read_bytes()
-        csi_data = (tmp_bcf.parent / f"{shard_filename}.csi").read_bytes()
+    Args:
+        tmp_shard: Path of the local shard file
+        shard_format: Shard output format, one of SHARD_FORMATS
 
-        # Write to storage
-        storage.write_file(bcf_data, shard_path)
-        storage.write_file(csi_data, f"{shard_path}.csi")
+    Returns:
+        tmp_shard
+    """
+    _, _, preset = _SHARD_FORMATS[shard_format]
+    # Build the CSI index in-process with htslib; single-threaded, as the
+    # workers already index several shards at once
+    # CSI index supports larger chromosomes than tabix
+    pysam.tabix_index(tmp_shard, preset=preset, csi=True, force=True)
+    return tmp_shard
+
+
+def _shard_filename(shard_prefix: str, shard_index: int, shard_format: str = "bcf") -> str:
+    suffix, _, _ = _SHARD_FORMATS[shard_format]
+    # Zero-padded so shards sort in order (up to 9999 shards)
+    return f"{shard_prefix}_{shard_index:04d}{suffix}"
+
+
+def _write_text_vcf(path: Path, header_text: bytes, records_text: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(header_text)
+        f.write(records_text)
 
-    return shard_path
+
+def _convert_to_bcf(tmp_vcf: Path, tmp_bcf: str, threads: int) -> None:
+    """Parse a VCF file and write its records as BCF."""
+    with pysam.VariantFile(str(tmp_vcf)) as vcf_in, pysam.VariantFile(
+        tmp_bcf, 'wb', header=vcf_in.header, threads=threads
+    ) as bcf_out:
+        for record in vcf_in:
+            bcf_out.write(record)
 
 
 if __name__ == "__main__":
@@ -217,7 +530,11 @@ if __name__ == "__main__":
         default=10000,
         help="Number of variant records per shard (default: 10000)"
     )
-    parser.add_argument("--region", help="Genomic region to filter")
+    parser.add_argument(
+        "--region",
+        action="append",
+        help="Genomic region to filter; repeat to shard several regions in one task"
+    )
     parser.add_argument(
         "--storage-type",
         default="local",
@@ -230,6 +547,29 @@ if __name__ == "__main__":
         help="Base path for local storage"
     )
     parser.add_argument("--run-id", help="Run identifier (defaults to timestamp)")
+    parser.add_argument(
+        "--format",
+        dest="shard_format",
+        default="bcf",
+        choices=SHARD_FORMATS,
+        help="Shard output format (default: bcf)"
+    )
+    parser.add_argument(
+        "--shard-prefix",
+        default="shard",
+        help="Shard filename prefix (default: shard)"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="htslib compression/decompression threads (default: half the CPU count, "
+             "between 2 and 4); shard workers only use them with --workers 1"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Shard-writing worker processes (default: CPU count, at most 4)"
+    )
 
     args = parser.parse_args()
 
@@ -240,6 +580,10 @@ if __name__ == "__main__":
         storage_type=args.storage_type,
         storage_base_path=args.storage_base_path,
         run_id=args.run_id,
+        shard_prefix=args.shard_prefix,
+        shard_format=args.shard_format,
+        threads=args.threads,
+        workers=args.workers,
     )
 
     print("\nGenerated shards:")
@@ -0,0 +1,132 @@
+"""Tests for core data models."""
+import numpy as np
+import pytest
+
+from src.models import VariantBatch, VariantRecord
+
+
+def _make_batch():
+    return VariantBatch(
+        contigs=["chr21", "chr22"],
+        chrom_codes=np.array([0, 1], dtype=np.int16),
+        pos=np.array([1000, 2000], dtype=np.int64),
+        qual=np.array([50.0, np.nan], dtype=np.float32),
+        ref=["A", "C"],
+        alts=["G", ""],
+        id=["rs1", None],
+        filter=["PASS", None],
+    )
+
+
+class TestVariantRecord:
+    """Test VariantRecord construction."""
+
+    def test_record_defaults(self):
+        """Test constructing a record with default optional fields."""
+        record = VariantRecord(chrom="chr21", pos=1000, ref="A", alts=("G",), qual=30.0)
+        assert record.chrom == "chr21"
+        assert record.alts == ("G",)
+        assert record.id is None
+        assert record.filter is None
+
+    def test_validate(self):
+        """Test that validate() accepts good records and rejects bad values."""
+        record = VariantRecord("chr21", 1000, "A", qual=30.0)
+        assert record.validate() is record
+
+        with pytest.raises(ValueError, match="Quality score must be non-negative"):
+            VariantRecord("chr21", 1000, "A", qual=-1.0).validate()
+
+        with pytest.raises(ValueError, match="1-based"):
+            VariantRecord("chr21", 0, "A").validate()
+
+        with pytest.raises(ValueError, match="Reference allele"):
+            VariantRecord("chr21", 1000, "").validate()
+
+    def test_record_is_immutable(self):
+        """Test that record fields cannot be reassigned."""
+        record = VariantRecord("chr21", 1000, "A")
+        with pytest.raises(AttributeError):
+            record.pos = 2000
+
+    def test_record_has_no_instance_dict(self):
+        """Test that records carry no per-instance __dict__."""
+        record = VariantRecord("chr21", 1000, "A")
+        assert not hasattr(record, "__dict__")
+
+    def test_info_is_not_available(self):
+        """Test that INFO access fails loudly rather than returning nothing."""
+        with pytest.raises(NotImplementedError, match="fixed columns"):
+            _ = VariantRecord("chr21", 1000, "A").info
+
+
+class TestVariantBatch:
+    """Test VariantBatch column access."""
+
+    def test_len(self):
+        """Test batch length matches number of rows."""
+        assert len(_make_batch()) == 2
+
+    def test_row(self):
+        """Test building a record from a batch row."""
+        batch = _make_batch()
+
+        first = batch.row(0)
+        assert first.chrom == "chr21"
+        assert first.pos == 1000
+        assert first.alts == ("G",)
+        assert first.qual == 50.0
+
+        second = batch.row(1)
+        assert second.chrom == "chr22"
+        assert second.alts == ()
+        assert second.qual is None
+        assert second.filter is None
+
+    def test_alt_list(self):
+        """Test unpacking packed ALT alleles."""
+        batch = _make_batch()
+        batch.alts[0] = "G,T"
+
+        assert batch.alt_list(0) == ["G", "T"]
+        assert batch.alt_list(1) == []
+        assert batch.row(0).alts == ("G", "T")
+
+    def test_region_mask(self):
+        """Test selecting rows by contig and position range."""
+        batch = _make_batch()
+
+        assert batch.region_mask("chr22").tolist() == [False, True]
+        assert batch.region_mask("chr21", 1000, 1000).tolist() == [True, False]
+        assert batch.region_mask("chr21", 1001).tolist() == [False, False]
+        assert batch.region_mask("chrX").tolist() == [False, False]
+
+    def test_select(self):
+        """Test subsetting a batch with a boolean mask."""
+        batch = _make_batch()
+        subset = batch.select(batch.region_mask("chr22", end=5000))
+
+        assert len(subset) == 1
+        assert subset.contigs is batch.contigs
+        assert subset.row(0) == batch.row(1)
+
+    def test_to_dict(self):
+        """Test conversion to a dict of column arrays."""
+        columns = _make_batch().to_dict()
+
+        assert columns["chrom"][0] == "chr21"
+        assert columns["chrom"].tolist() == ["chr21", "chr22"]
+        assert columns["pos"].dtype == np.int64
+        assert columns["ref"].dtype == object
+        assert columns["id"].tolist() == ["rs1", None]
+
+    def test_to_arrow(self):
+        """Test conversion to an Arrow table."""
+        pytest.importorskip("pyarrow")
+        table = _make_batch().to_arrow()
+
+        assert table.num_rows == 2
+        assert table.column("chrom").to_pylist() == ["chr21", "chr22"]
+        assert table.schema.field("chrom").type.value_type.equals("large_string")
+        assert table.column("qual").to_pylist() == [50.0, None]
+        assert table.column("alts").to_pylist() == [["G"], []]
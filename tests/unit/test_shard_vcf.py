@@ -0,0 +1,92 @@
+"""Tests for the VCF sharding task."""
+from unittest.mock import patch
+
+import pysam
+import pytest
+
+from src.streaming import LocalVCFStreamer
+from src.tasks.shard_vcf import shard_vcf_task
+
+_HEADER = (
+    "##fileformat=VCFv4.2\n"
+    "##contig=<ID=chr21,length=46709983>\n"
+    "##contig=<ID=chr22,length=50818468>\n"
+    '##INFO=<ID=DP,Number=1,Type=Integer,Description="Depth">\n'
+    '##FORMAT=<ID=GT,Number=1,Type=String,Description="Genotype">\n'
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+)
+
+
+def _write_vcf(path, n):
+    """Write `n` records across two contigs as a plain-text VCF."""
+    with open(path, "w") as f:
+        f.write(_HEADER)
+        for i in range(n):
+            chrom = "chr21" if i < n // 2 else "chr22"
+            f.write(f"{chrom}\t{i + 1}\trs{i}\tA\tG\t30\tPASS\tDP={i}\tGT\t0/1\n")
+
+
+class TestShardVCFTask:
+    """Test shard_vcf_task end to end with a single worker."""
+
+    @pytest.mark.parametrize(
+        "source_name, shard_format",
+        [
+            # Whole-file text VCF: split into shards by line
+            ("input.vcf", "bcf"),
+            ("input.vcf", "vcfgz"),
+            ("input.vcf.gz", "bcf"),
+            # BCF source: records written straight into shard files
+            ("input.bcf", "bcf"),
+        ],
+    )
+    def test_shards_whole_file(self, tmp_path, source_name, shard_format):
+        """Test shard count, record count and index presence per source and format."""
+        source = tmp_path / source_name
+        text_vcf = tmp_path / "input.vcf"
+        _write_vcf(text_vcf, 25)
+        if source_name.endswith(".vcf.gz"):
+            pysam.tabix_compress(str(text_vcf), str(source))
+        elif source_name.endswith(".bcf"):
+            with pysam.VariantFile(str(text_vcf)) as vcf_in, pysam.VariantFile(
+                str(source), "wb", header=vcf_in.header
+            ) as bcf_out:
+                for record in vcf_in:
+                    bcf_out.write(record)
+
+        storage_path = tmp_path / "storage"
+        shards = shard_vcf_task(
+            str(source),
+            lines_per_shard=10,
+            storage_base_path=str(storage_path),
+            run_id="run",
+            shard_format=shard_format,
+            workers=1,
+        )
+
+        suffix = ".vcf.gz" if shard_format == "vcfgz" else ".bcf"
+        assert shards == [f"run/shards/shard_{i:04d}{suffix}" for i in range(3)]
+
+        counts = []
+        for shard in shards:
+            shard_file = storage_path / shard
+            assert (storage_path / f"{shard}.csi").exists()
+            with pysam.VariantFile(str(shard_file)) as shard_in:
+                counts.append(sum(1 for _ in shard_in))
+        assert counts == [10, 10, 5]
+
+    def test_split_lines_never_opens_streamer(self, tmp_path):
+        """Test that line splitting reads the file without opening the streamer."""
+        source = tmp_path / "input.vcf"
+        _write_vcf(source, 5)
+
+        # Opening a region-less .vcf.gz streamer would start a decompressor
+        with patch.object(LocalVCFStreamer, "open", side_effect=AssertionError):
+            shards = shard_vcf_task(
+                str(source),
+                storage_base_path=str(tmp_path / "storage"),
+                run_id="run",
+                workers=1,
+            )
+
+        assert shards == ["run/shards/shard_0000.bcf"]
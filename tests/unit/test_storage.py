@@ -1,9 +1,11 @@
 """Unit tests for storage abstraction."""
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
 from src.storage import create_storage
+from src.storage.gcs import GCSStorageHandler
 from src.storage.local import LocalStorageHandler
 
 
@@ -21,10 +23,18 @@ class TestStorageFactory:
         storage = create_storage(base_path=str(tmp_path))
         assert isinstance(storage, LocalStorageHandler)
 
-    def test_create_gcs_storage_not_implemented(self):
-        """Test GCS storage raises NotImplementedError."""
-        with pytest.raises(NotImplementedError):
-            create_storage("gcs", bucket="test-bucket")
+    @patch('src.storage.gcs._get_client')
+    def test_create_gcs_storage(self, mock_get_client):
+        """Test creating GCS storage handler."""
+        pytest.importorskip("google.cloud.storage")
+        storage = create_storage("gcs", bucket="test-bucket", prefix="runs/")
+        assert isinstance(storage, GCSStorageHandler)
+        assert storage.get_uri("a/b.bcf") == "gs://test-bucket/runs/a/b.bcf"
+
+    def test_create_gcs_storage_requires_bucket(self):
+        """Test GCS storage without a bucket raises ValueError."""
+        with pytest.raises(ValueError, match="requires 'bucket'"):
+            create_storage("gcs")
 
     def test_unsupported_storage_type(self):
         """Test unsupported storage type raises ValueError."""
@@ -46,6 +56,21 @@ class TestLocalStorage:
         read_data = storage.read_file("test_file.txt")
         assert read_data == test_data
 
+    def test_read_file_mmap(self, tmp_path):
+        """Test reading files through a memory map."""
+        storage = LocalStorageHandler(base_path=str(tmp_path))
+
+        storage.write_file(b"mapped content", "mapped.txt")
+        storage.write_file(b"", "empty.txt")
+
+        view = storage.read_file_mmap("mapped.txt")
+        assert view[:6] == b"mapped"
+        assert bytes(view) == b"mapped content"
+        assert len(storage.read_file_mmap("empty.txt")) == 0
+
+        with pytest.raises(FileNotFoundError):
+            storage.read_file_mmap("missing.txt")
+
     def test_write_creates_directories(self, tmp_path):
         """Test that write_file creates necessary directories."""
         storage = LocalStorageHandler(base_path=str(tmp_path))
@@ -55,6 +80,31 @@ class TestLocalStorage:
 
         assert (tmp_path / "nested" / "dir" / "file.txt").exists()
 
+    def test_write_many(self, tmp_path):
+        """Test writing several files in one call."""
+        storage = LocalStorageHandler(base_path=str(tmp_path))
+
+        items = [(f"data {i}".encode(), f"batch/dir{i % 2}/file{i}.txt") for i in range(10)]
+        written = storage.write_many(items)
+
+        assert written == [str(tmp_path / dest) for _, dest in items]
+        for data, dest in items:
+            assert storage.read_file(dest) == data
+
+    def test_write_file_from_path(self, tmp_path):
+        """Test copying and moving existing files into storage."""
+        storage = LocalStorageHandler(base_path=str(tmp_path / "store"))
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"shard bytes" * 1000)
+
+        storage.write_file_from_path(str(source), "copied/shard.bin")
+        assert source.exists()
+        assert storage.read_file("copied/shard.bin") == b"shard bytes" * 1000
+
+        storage.write_file_from_path(str(source), "moved/shard.bin", move=True)
+        assert not source.exists()
+        assert storage.read_file("moved/shard.bin") == b"shard bytes" * 1000
+
     def test_file_exists(self, tmp_path):
         """Test exists method."""
         storage = LocalStorageHandler(base_path=str(tmp_path))
@@ -80,6 +130,17 @@ class TestLocalStorage:
         dir_files = storage.list_files("dir")
         assert len(dir_files) == 2
 
+    def test_list_files_sorted(self, tmp_path):
+        """Test listing files in sorted order, including a single-file prefix."""
+        storage = LocalStorageHandler(base_path=str(tmp_path))
+
+        for name in ["b.txt", "a/2.txt", "a/1.txt", "c/d/e.txt"]:
+            storage.write_file(b"x", name)
+
+        assert storage.list_files("", sort=True) == ["a/1.txt", "a/2.txt", "b.txt", "c/d/e.txt"]
+        assert storage.list_files("b.txt") == ["b.txt"]
+        assert storage.list_files("missing") == []
+
     def test_delete_file(self, tmp_path):
         """Test deleting files."""
         storage = LocalStorageHandler(base_path=str(tmp_path))
@@ -109,6 +170,28 @@ class TestLocalStorage:
         content = storage.read_file("streamed.txt")
         assert content == b"line 1\nline 2\n"
 
+    def test_open_for_appending(self, tmp_path):
+        """Test appending to a file across several handles."""
+        storage = LocalStorageHandler(base_path=str(tmp_path))
+
+        storage.write_file(b"line 1\n", "appended.txt")
+        with storage.open_for_appending("appended.txt") as f:
+            f.write(b"line 2\n")
+        with storage.open_for_appending("appended.txt") as f:
+            f.write(b"line 3\n")
+
+        content = storage.read_file("appended.txt")
+        assert content == b"line 1\nline 2\nline 3\n"
+
+    def test_write_file_with_fdatasync(self, tmp_path):
+        """Test writing a file with an explicit data sync."""
+        storage = LocalStorageHandler(base_path=str(tmp_path))
+
+        storage.write_file(b"old content", "synced.txt")
+        storage.write_file(b"new", "synced.txt", fdatasync=True)
+
+        assert storage.read_file("synced.txt") == b"new"
+
     def test_security_path_escape(self, tmp_path):
         """Test that paths cannot escape base directory."""
         storage = LocalStorageHandler(base_path=str(tmp_path))
@@ -116,3 +199,56 @@ class TestLocalStorage:
         with pytest.raises(ValueError, match="escapes base directory"):
             storage.write_file(b"bad", "../outside.txt")
 
+    def test_security_sibling_prefix_escape(self, tmp_path):
+        """Test that a sibling directory sharing the base name prefix is rejected."""
+        storage = LocalStorageHandler(base_path=str(tmp_path / "data"))
+
+        with pytest.raises(ValueError, match="escapes base directory"):
+            storage.write_file(b"bad", "../data2/outside.txt")
+
+    def test_security_absolute_path_escape(self, tmp_path):
+        """Test that absolute paths outside the base directory are rejected."""
+        storage = LocalStorageHandler(base_path=str(tmp_path / "data"))
+
+        with pytest.raises(ValueError, match="escapes base directory"):
+            storage.read_file("/etc/passwd")
+
+
+class TestGCSStorage:
+    """Test GCS storage handler against a mocked client."""
+
+    @pytest.fixture
+    def storage(self):
+        pytest.importorskip("google.cloud.storage")
+        with patch('src.storage.gcs._get_client') as mock_get_client:
+            yield GCSStorageHandler(bucket="test-bucket", prefix="runs")
+        mock_get_client.assert_called_once()
+
+    def test_write_file(self, storage):
+        """Test uploading bytes to a prefixed blob."""
+        uri = storage.write_file(b"data", "r1/shard_0000.bcf")
+
+        storage.bucket_obj.blob.assert_called_with("runs/r1/shard_0000.bcf", chunk_size=8 * 1024 * 1024)
+        storage.bucket_obj.blob.return_value.upload_from_string.assert_called_once()
+        assert uri == "gs://test-bucket/runs/r1/shard_0000.bcf"
+
+    @patch('google.cloud.storage.transfer_manager.upload_many')
+    def test_write_many_uses_transfer_manager(self, mock_upload_many, storage):
+        """Test that batched writes go through one transfer manager call."""
+        uris = storage.write_many([(b"1", "a.bcf"), (b"2", "b.bcf")])
+
+        mock_upload_many.assert_called_once()
+        pairs = mock_upload_many.call_args.args[0]
+        assert [stream.read() for stream, _ in pairs] == [b"1", b"2"]
+        assert mock_upload_many.call_args.kwargs["raise_exception"] is True
+        assert uris == ["gs://test-bucket/runs/a.bcf", "gs://test-bucket/runs/b.bcf"]
+
+    def test_list_files_strips_prefix(self, storage):
+        """Test listing blobs relative to the handler prefix."""
+        blob_a, blob_b = Mock(), Mock()
+        blob_a.name = "runs/r1/b.bcf"
+        blob_b.name = "runs/r1/a.bcf"
+        storage.client.list_blobs.return_value = [blob_a, blob_b]
+
+        assert storage.list_files("r1", sort=True) == ["r1/a.bcf", "r1/b.bcf"]
+        storage.client.list_blobs.assert_called_once_with("test-bucket", prefix="runs/r1")
@@ -1,17 +1,35 @@
 """Tests for VCF streaming implementations."""
-import os
-import tempfile
-from unittest.mock import Mock, patch
+import itertools
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pysam
 import pytest
 
 from src.streaming import (
+    CyVCF2Streamer,
     HttpsVCFStreamer,
     LocalVCFStreamer,
+    MmapVCFStreamer,
     VCFStreamer,
+    create_parallel_streamer,
     create_streamer,
 )
+from src.streaming.base import DEFAULT_THREADS
+
+
+def _collect(streamer, n=None):
+    """
+    Read up to `n` records (all when None) from `streamer.stream()`.
+
+    islice stops after `n` records, so a test that only checks the head of a
+    large stream never reads the rest. Pipelines can use the same pattern to
+    bound how much of a stream they hold.
+    """
+    out = []
+    for record in itertools.islice(streamer.stream(), n):
+        out.append(record)
+    return out
 
 
 class TestVCFStreamerBase:
@@ -22,6 +40,19 @@ class TestVCFStreamerBase:
         with pytest.raises(TypeError):
             VCFStreamer("test.vcf")
 
+    def test_streamers_have_no_instance_dict(self, tmp_path):
+        """Test that every streamer stores its state in slots."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+        streamers = [
+            LocalVCFStreamer(str(vcf_file)),
+            HttpsVCFStreamer("https://example.com/file.vcf.gz"),
+            CyVCF2Streamer(str(vcf_file)),
+            MmapVCFStreamer(str(vcf_file)),
+        ]
+        for streamer in streamers:
+            assert not hasattr(streamer, "__dict__")
+
 
 class TestLocalVCFStreamer:
     """Test LocalVCFStreamer implementation."""
@@ -48,8 +79,22 @@ class TestLocalVCFStreamer:
         streamer = LocalVCFStreamer(str(vcf_file), region="chr21:1000-2000")
         assert streamer.region == "chr21:1000-2000"
 
-    @patch('src.streaming.local.pysam.VariantFile')
-    def test_stream_yields_pysam_records(self, mock_variant_file):
+    def test_region_parsing(self, tmp_path):
+        """Test that regions are parsed once, into 0-based half-open bounds."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+
+        streamer = LocalVCFStreamer(str(vcf_file), region="chr21:1-2")
+        assert streamer._region_parsed == {"chr21:1-2": ("chr21", 0, 2)}
+
+        streamer.region = ["chr22", "HLA-A*01:01:01:01"]
+        assert streamer._region_parsed == {
+            "chr22": ("chr22", None, None),
+            "HLA-A*01:01:01:01": None,
+        }
+
+    @patch('pysam.VariantFile')
+    def test_stream_yields_pysam_records(self, mock_variant_file, tmp_path):
         """Test that stream method yields pysam.VariantRecord objects."""
         # Create a mock pysam record
         mock_record = Mock(spec=pysam.VariantRecord)
@@ -64,40 +109,50 @@ class TestLocalVCFStreamer:
         mock_vcf.header = Mock(spec=pysam.VariantHeader)
         mock_variant_file.return_value = mock_vcf
 
-        # Create temp file for the test
-        with tempfile.NamedTemporaryFile(suffix=".vcf", delete=False) as tmp:
-            tmp_path = tmp.name
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
 
-        try:
-            streamer = LocalVCFStreamer(tmp_path)
-            records = list(streamer.stream())
+        streamer = LocalVCFStreamer(str(vcf_file))
+        records = _collect(streamer)
 
-            assert len(records) == 1
-            assert records[0].chrom == "chr21"
-            assert records[0].pos == 1000
-        finally:
-            os.unlink(tmp_path)
+        assert len(records) == 1
+        assert records[0].chrom == "chr21"
+        assert records[0].pos == 1000
+
+    @patch('src.streaming.local._READ_AHEAD', True)
+    @patch('pysam.VariantFile')
+    def test_read_ahead_preserves_order(self, mock_variant_file, tmp_path):
+        """Test that records read ahead on a background thread keep their order."""
+        mock_vcf = MagicMock()
+        mock_vcf.__iter__.return_value = iter([Mock(pos=i) for i in range(100)])
+        mock_variant_file.return_value = mock_vcf
 
-    @patch('src.streaming.local.pysam.VariantFile')
-    def test_get_header(self, mock_variant_file):
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+
+        with LocalVCFStreamer(str(vcf_file)) as streamer:
+            positions = [record.pos for record in streamer.stream()]
+            assert streamer._prefetcher is None
+
+        assert positions == list(range(100))
+
+    @patch('pysam.VariantFile')
+    def test_get_header(self, mock_variant_file, tmp_path):
         """Test getting VCF header."""
         mock_header = Mock(spec=pysam.VariantHeader)
         mock_vcf = Mock()
         mock_vcf.header = mock_header
         mock_variant_file.return_value = mock_vcf
 
-        with tempfile.NamedTemporaryFile(suffix=".vcf", delete=False) as tmp:
-            tmp_path = tmp.name
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
 
-        try:
-            streamer = LocalVCFStreamer(tmp_path)
-            header = streamer.get_header()
-            assert header == mock_header
-        finally:
-            os.unlink(tmp_path)
+        streamer = LocalVCFStreamer(str(vcf_file))
+        header = streamer.get_header()
+        assert header == mock_header
 
-    @patch('src.streaming.local.pysam.VariantFile')
-    def test_stream_with_region(self, mock_variant_file):
+    @patch('pysam.VariantFile')
+    def test_stream_with_region(self, mock_variant_file, tmp_path):
         """Test streaming with region filter."""
         mock_record = Mock(spec=pysam.VariantRecord)
         mock_record.chrom = "chr21"
@@ -108,38 +163,185 @@ class TestLocalVCFStreamer:
         mock_vcf.header = Mock(spec=pysam.VariantHeader)
         mock_variant_file.return_value = mock_vcf
 
-        with tempfile.NamedTemporaryFile(suffix=".vcf", delete=False) as tmp:
-            tmp_path = tmp.name
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+
+        streamer = LocalVCFStreamer(str(vcf_file), region="chr21:1000-2000")
+        variants = _collect(streamer)
+
+        # The region reaches the index as parsed, 0-based half-open bounds
+        mock_vcf.fetch.assert_called_once_with("chr21", 999, 2000)
+        assert len(variants) == 1
+
+    @patch('pysam.VariantFile')
+    def test_stream_with_unparsed_region(self, mock_variant_file, tmp_path):
+        """Test that region strings in other forms are left to htslib to parse."""
+        mock_vcf = Mock()
+        mock_vcf.fetch = Mock(return_value=iter([]))
+        mock_variant_file.return_value = mock_vcf
 
-        try:
-            streamer = LocalVCFStreamer(tmp_path, region="chr21:1000-2000")
-            variants = list(streamer.stream())
+        vcf_file = tmp_path / "test.vcf.gz"
+        vcf_file.touch()
 
-            # Verify fetch was called with region
-            mock_vcf.fetch.assert_called_once_with(region="chr21:1000-2000")
-            assert len(variants) == 1
-        finally:
-            os.unlink(tmp_path)
+        streamer = LocalVCFStreamer(str(vcf_file), region="HLA-A*01:01:01:01")
+        _collect(streamer)
 
-    @patch('src.streaming.local.pysam.VariantFile')
-    def test_context_manager_closes_file(self, mock_variant_file):
+        mock_vcf.fetch.assert_called_once_with(region="HLA-A*01:01:01:01")
+
+    @patch('pysam.VariantFile')
+    def test_stream_with_region_list(self, mock_variant_file, tmp_path):
+        """Test that a list of regions is fetched in order on one handle."""
+        by_region = {"chr21": [Mock(pos=1)], "chr22": [Mock(pos=2), Mock(pos=3)]}
+
+        mock_vcf = Mock()
+        mock_vcf.fetch = Mock(side_effect=lambda contig, start, end: iter(by_region[contig]))
+        mock_variant_file.return_value = mock_vcf
+
+        vcf_file = tmp_path / "test.vcf.gz"
+        vcf_file.touch()
+
+        streamer = LocalVCFStreamer(str(vcf_file), region=["chr21", "chr22"])
+        positions = [record.pos for record in streamer.stream()]
+
+        assert positions == [1, 2, 3]
+        assert [c.args[0] for c in mock_vcf.fetch.call_args_list] == ["chr21", "chr22"]
+        mock_variant_file.assert_called_once()
+
+    @patch('pysam.VariantFile')
+    def test_context_manager_closes_file(self, mock_variant_file, tmp_path):
         """Test that context manager properly closes file."""
         mock_vcf = Mock()
         mock_vcf.__iter__ = Mock(return_value=iter([]))
         mock_vcf.header = Mock(spec=pysam.VariantHeader)
         mock_variant_file.return_value = mock_vcf
 
-        with tempfile.NamedTemporaryFile(suffix=".vcf", delete=False) as tmp:
-            tmp_path = tmp.name
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+
+        with LocalVCFStreamer(str(vcf_file)) as streamer:
+            _collect(streamer)
+
+        # Decompression is always handed to background threads
+        assert mock_variant_file.call_args.kwargs["threads"] >= 2
+        # Verify close was called
+        mock_vcf.close.assert_called()
+
+
+    @patch('src.streaming.local.subprocess.Popen')
+    @patch('src.streaming.local.shutil.which')
+    @patch('pysam.VariantFile')
+    def test_gzip_uses_parallel_decompressor(
+        self, mock_variant_file, mock_which, mock_popen, tmp_path
+    ):
+        """Test that whole-file .vcf.gz streams are read through pigz when available."""
+        mock_which.side_effect = lambda name: "/usr/bin/pigz" if name == "pigz" else None
+        mock_popen.return_value.wait.return_value = 0
+        mock_vcf = Mock()
+        mock_vcf.__iter__ = Mock(return_value=iter([]))
+        mock_variant_file.return_value = mock_vcf
+
+        vcf_file = tmp_path / "test.vcf.gz"
+        vcf_file.touch()
+
+        with LocalVCFStreamer(str(vcf_file)) as streamer:
+            _collect(streamer)
+
+        command = mock_popen.call_args.args[0]
+        assert command[0] == "/usr/bin/pigz"
+        assert command[-1] == str(vcf_file)
+        mock_variant_file.assert_called_once_with(mock_popen.return_value.stdout)
+        mock_popen.return_value.wait.assert_called()
+
+    @patch('src.streaming.local.shutil.which')
+    @patch('pysam.VariantFile')
+    def test_gzip_region_query_uses_htslib(self, mock_variant_file, mock_which, tmp_path):
+        """Test that region queries bypass the external decompressor."""
+        mock_which.return_value = "/usr/bin/pigz"
+
+        vcf_file = tmp_path / "test.vcf.gz"
+        vcf_file.touch()
+
+        streamer = LocalVCFStreamer(str(vcf_file), region="chr21", threads=2)
+        streamer.open()
+
+        mock_variant_file.assert_called_once_with(str(vcf_file), threads=2)
+
+    @patch('src.streaming.local.shutil.which', return_value=None)
+    @patch('pysam.VariantFile')
+    def test_gzip_uses_threads(self, mock_variant_file, mock_which, tmp_path):
+        """Test that .vcf.gz without an external decompressor uses htslib threads."""
+        vcf_file = tmp_path / "test.vcf.gz"
+        vcf_file.touch()
+
+        LocalVCFStreamer(str(vcf_file)).open()
+
+        mock_variant_file.assert_called_once_with(str(vcf_file), threads=DEFAULT_THREADS)
+        assert 2 <= DEFAULT_THREADS <= 4
+
+    @patch('pysam.VariantFile')
+    def test_stream_batches(self, mock_variant_file, tmp_path):
+        """Test that stream_batches yields column-oriented batches."""
+        records = []
+        for i in range(5):
+            mock_record = Mock(spec=pysam.VariantRecord)
+            mock_record.chrom = "chr21"
+            mock_record.pos = 1000 + i
+            mock_record.alleles = ("A", "G")
+            mock_record.id = None
+            mock_record.qual = None if i == 4 else 30.0
+            mock_record.filter = ["PASS"] if i < 3 else ["LowQual", "LowDP"]
+            records.append(mock_record)
+        records[4].chrom = "chrUn"
+
+        mock_vcf = Mock()
+        mock_vcf.header.contigs = {"chr1": None, "chr21": None}
+        mock_vcf.__iter__ = Mock(return_value=iter(records))
+        mock_variant_file.return_value = mock_vcf
+
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
 
-        try:
-            with LocalVCFStreamer(tmp_path) as streamer:
-                list(streamer.stream())
+        streamer = LocalVCFStreamer(str(vcf_file))
+        batches = list(streamer.stream_batches(batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0].pos.dtype == np.int64
+        assert batches[0].pos.tolist() == [1000, 1001]
+        assert batches[1].filter == ["PASS", "LowQual,LowDP"]
+        # Repeated filter combinations share one string object
+        assert batches[1].filter[1] is batches[2].filter[0]
+        # Codes follow header order; unknown contigs are appended
+        assert batches[0].chrom_codes.dtype == np.int16
+        assert batches[0].chrom_codes.tolist() == [1, 1]
+        assert batches[2].contigs == ["chr1", "chr21", "chrUn"]
+        assert batches[0].to_dict()["chrom"][0] == "chr21"
+        assert batches[2].to_dict()["chrom"].tolist() == ["chrUn"]
+
+        last = batches[2].row(0)
+        assert last.chrom == "chrUn"
+        assert last.pos == 1004
+        assert last.qual is None
+
+
+    @patch('pysam.VariantFile')
+    def test_stream_batches_rejects_negative_qual(self, mock_variant_file, tmp_path):
+        """Test that negative quality scores are rejected during conversion."""
+        mock_record = Mock(spec=pysam.VariantRecord)
+        mock_record.chrom = "chr21"
+        mock_record.pos = 1000
+        mock_record.qual = -1.0
 
-            # Verify close was called
-            mock_vcf.close.assert_called()
-        finally:
-            os.unlink(tmp_path)
+        mock_vcf = Mock()
+        mock_vcf.header.contigs = {}
+        mock_vcf.__iter__ = Mock(return_value=iter([mock_record]))
+        mock_variant_file.return_value = mock_vcf
+
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.touch()
+
+        streamer = LocalVCFStreamer(str(vcf_file))
+        with pytest.raises(ValueError, match="Quality score must be non-negative"):
+            list(streamer.stream_batches())
 
 
 class TestHttpsVCFStreamer:
@@ -158,8 +360,20 @@ class TestHttpsVCFStreamer:
         streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz")
         assert streamer.source == "https://example.com/file.vcf.gz"
         assert streamer.region is None
+        assert streamer.threads >= 1
+
+    @patch('pysam.VariantFile')
+    def test_open_passes_threads(self, mock_variant_file):
+        """Test that the BGZF thread count is passed through to pysam."""
+        streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz", threads=3)
+        streamer.open()
 
-    @patch('src.streaming.https.pysam.VariantFile')
+        mock_variant_file.assert_called_once_with("https://example.com/file.vcf.gz", threads=3)
+
+        with pytest.raises(ValueError, match="threads"):
+            HttpsVCFStreamer("https://example.com/file.vcf.gz", threads=0)
+
+    @patch('pysam.VariantFile')
     def test_stream_yields_pysam_records(self, mock_variant_file):
         """Test that stream method yields pysam.VariantRecord objects."""
         mock_record = Mock(spec=pysam.VariantRecord)
@@ -172,12 +386,59 @@ class TestHttpsVCFStreamer:
         mock_variant_file.return_value = mock_vcf
 
         streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz")
-        records = list(streamer.stream())
+        records = _collect(streamer)
 
         assert len(records) == 1
         assert records[0].chrom == "chr21"
 
-    @patch('src.streaming.https.pysam.VariantFile')
+    @patch('pysam.VariantFile')
+    def test_stream_preserves_order(self, mock_variant_file):
+        """Test that read-ahead streaming yields every record in order."""
+        records = []
+        for i in range(1000):
+            mock_record = Mock(spec=pysam.VariantRecord)
+            mock_record.pos = i
+            records.append(mock_record)
+
+        mock_vcf = Mock()
+        mock_vcf.__iter__ = Mock(return_value=iter(records))
+        mock_variant_file.return_value = mock_vcf
+
+        streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz")
+        positions = [record.pos for record in streamer.stream()]
+
+        assert positions == list(range(1000))
+
+    @patch('pysam.VariantFile')
+    def test_close_during_stream_stops_read_ahead(self, mock_variant_file):
+        """Test that closing mid-stream stops the read-ahead thread first."""
+        mock_vcf = Mock()
+        mock_vcf.__iter__ = Mock(return_value=iter([Mock()] * 10000))
+        mock_variant_file.return_value = mock_vcf
+
+        with HttpsVCFStreamer("https://example.com/file.vcf.gz") as streamer:
+            records = streamer.stream()
+            next(records)
+
+        assert streamer._prefetcher is None
+        mock_vcf.close.assert_called_once()
+
+    @patch('pysam.VariantFile')
+    def test_stream_propagates_read_errors(self, mock_variant_file):
+        """Test that errors raised while reading ahead surface as IOError."""
+        def failing_records():
+            yield Mock()
+            raise OSError("truncated file")
+
+        mock_vcf = Mock()
+        mock_vcf.__iter__ = Mock(return_value=failing_records())
+        mock_variant_file.return_value = mock_vcf
+
+        streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz")
+        with pytest.raises(IOError, match="truncated file"):
+            _collect(streamer)
+
+    @patch('pysam.VariantFile')
     def test_get_header(self, mock_variant_file):
         """Test getting VCF header from remote file."""
         mock_header = Mock(spec=pysam.VariantHeader)
@@ -189,7 +450,22 @@ class TestHttpsVCFStreamer:
         header = streamer.get_header()
         assert header == mock_header
 
-    @patch('src.streaming.https.pysam.VariantFile')
+    @patch('pysam.VariantFile')
+    def test_context_manager_closes_connection(self, mock_variant_file):
+        """Test that the header and records share one connection, closed on exit."""
+        mock_vcf = MagicMock()
+        mock_vcf.__iter__.return_value = iter([Mock(spec=pysam.VariantRecord)])
+        mock_variant_file.return_value = mock_vcf
+
+        with HttpsVCFStreamer("https://example.com/file.vcf.gz") as streamer:
+            streamer.get_header()
+            _collect(streamer)
+
+        mock_variant_file.assert_called_once()
+        mock_vcf.close.assert_called_once()
+        assert streamer._vcf_handle is None
+
+    @patch('pysam.VariantFile')
     def test_stream_raises_ioerror_on_failure(self, mock_variant_file):
         """Test that streaming failures raise IOError."""
         mock_variant_file.side_effect = Exception("Connection failed")
@@ -197,7 +473,150 @@ class TestHttpsVCFStreamer:
         streamer = HttpsVCFStreamer("https://example.com/file.vcf.gz")
 
         with pytest.raises(IOError):
-            list(streamer.stream())
+            _collect(streamer)
+
+
+class TestCyVCF2Streamer:
+    """Test CyVCF2Streamer implementation."""
+
+    def test_init_with_nonexistent_file_raises_error(self):
+        """Test that missing local files are rejected before cyvcf2 is imported."""
+        with pytest.raises(FileNotFoundError):
+            CyVCF2Streamer("/nonexistent/file.vcf.gz")
+
+    def test_stream_yields_variant_records(self, tmp_path):
+        """Test that records and batches carry the fixed VCF columns."""
+        pytest.importorskip("cyvcf2")
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text(
+            "##fileformat=VCFv4.2\n"
+            "##contig=<ID=chr21>\n"
+            "##FILTER=<ID=LowQual,Description=\"Low quality\">\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+            "chr21\t1000\trs1\tA\tG,T\t30\tPASS\t.\n"
+            "chr21\t2000\t.\tC\t.\t.\tLowQual\t.\n"
+        )
+
+        with CyVCF2Streamer(str(vcf_file)) as streamer:
+            records = _collect(streamer)
+
+        assert records[0].chrom == "chr21"
+        assert records[0].chrom is records[1].chrom
+        assert records[0].pos == 1000
+        assert records[0].alts == ("G", "T")
+        assert records[0].id == "rs1"
+        assert records[1].qual is None
+        assert records[1].filter == "LowQual"
+
+        with CyVCF2Streamer(str(vcf_file)) as streamer:
+            (batch,) = streamer.stream_batches()
+
+        assert batch.alts == ["G,T", ""]
+        assert batch.filter == ["PASS", "LowQual"]
+
+    def test_stream_shares_repeated_values(self, tmp_path):
+        """Test that repeated contig, ALT and FILTER values are shared across records."""
+        pytest.importorskip("cyvcf2")
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text(
+            "##fileformat=VCFv4.2\n"
+            "##contig=<ID=chr21>\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+            + "".join(f"chr21\t{pos}\t.\tA\tG\t30\tPASS\t.\n" for pos in (1, 2, 3))
+        )
+
+        with CyVCF2Streamer(str(vcf_file)) as streamer:
+            records = _collect(streamer)
+
+        assert [record.pos for record in records] == [1, 2, 3]
+        assert records[0].chrom is records[-1].chrom
+        assert records[0].alts is records[-1].alts
+        assert records[0].filter is records[-1].filter
+
+
+class TestMmapVCFStreamer:
+    """Test MmapVCFStreamer implementation."""
+
+    def test_rejects_compressed_input(self, tmp_path):
+        """Test that compressed files are refused before they are opened."""
+        with pytest.raises(ValueError, match="uncompressed"):
+            MmapVCFStreamer(str(tmp_path / "test.vcf.gz"))
+
+    def test_round_trip(self, tmp_path):
+        """Test that 1000 written lines are streamed back field for field."""
+        vcf_file = tmp_path / "test.vcf"
+        expected = []
+        with open(vcf_file, "w") as f:
+            f.write(
+                "##fileformat=VCFv4.2\n"
+                "##contig=<ID=chr21,length=46709983>\n"
+                "##contig=<ID=chr22>\n"
+                "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+            )
+            for i in range(1000):
+                chrom = "chr21" if i < 600 else "chr22"
+                alts = ("G",) if i % 3 else ("GT", "C")
+                qual = None if i % 7 == 0 else float(i)
+                filt = "PASS" if i % 2 else "q10;s50"
+                f.write(
+                    f"{chrom}\t{i + 1}\trs{i}\tA\t{','.join(alts)}\t"
+                    f"{'.' if qual is None else qual}\t{filt}\tDP=3\tGT\t0/1\n"
+                )
+                expected.append((chrom, i + 1, f"rs{i}", alts, qual, filt.replace(";", ",")))
+
+        with MmapVCFStreamer(str(vcf_file)) as streamer:
+            assert streamer.get_header().startswith("##fileformat=VCFv4.2")
+            records = _collect(streamer)
+            batches = list(streamer.stream_batches(batch_size=256))
+
+        assert [
+            (r.chrom, r.pos, r.id, r.alts, r.qual, r.filter) for r in records
+        ] == expected
+        assert all(r.ref == "A" for r in records)
+        assert records[0].chrom is records[599].chrom
+
+        assert sum(len(batch) for batch in batches) == 1000
+        assert batches[0].contigs == ["chr21", "chr22"]
+        assert batches[0].alts[0] == "GT,C"
+        assert batches[0].filter[0] == "q10,s50"
+
+    def test_stream_with_region(self, tmp_path):
+        """Test that regions keep records overlapping them, as an index query does."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text(
+            "##fileformat=VCFv4.2\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\n"
+            + "".join(f"chr{c}\t{p}\t.\tA\t.\t.\t.\n" for c in (1, 2) for p in (5, 10, 15))
+        )
+
+        streamer = MmapVCFStreamer(str(vcf_file), region=["chr1:10-15", "chr2:6"])
+        with streamer:
+            records = _collect(streamer)
+
+        assert [(r.chrom, r.pos) for r in records] == [
+            ("chr1", 10), ("chr1", 15), ("chr2", 10), ("chr2", 15)
+        ]
+        assert records[0].alts == ()
+        assert records[0].filter is None
+
+    def test_region_keeps_records_spanning_its_start(self, tmp_path):
+        """Test that deletions and symbolic alleles reaching into a region are kept."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text(
+            "##fileformat=VCFv4.2\n"
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tS1\n"
+            "chr1\t50\t.\tA\t<DEL>\t.\tPASS\tSVTYPE=DEL;END=150\tGT\t0/1\n"
+            "chr1\t80\t.\tA\t<DEL>\t.\tPASS\tEND=99\tGT\t0/1\n"
+            "chr1\t90\t.\tA\tG\t.\tPASS\t.\tGT\t0/1\n"
+            f"chr1\t95\t.\t{'A' * 26}\tA\t.\tPASS\t.\tGT\t0/1\n"
+            "chr1\t200\t.\tA\tG\t.\tPASS\t.\tGT\t0/1\n"
+            "chr1\t201\t.\tA\tG\t.\tPASS\t.\tGT\t0/1\n"
+        )
+
+        with MmapVCFStreamer(str(vcf_file), region="chr1:100-200") as streamer:
+            positions = [record.pos for record in streamer.stream()]
+
+        assert positions == [50, 95, 200]
 
 
 class TestStreamerFactory:
@@ -234,6 +653,15 @@ class TestStreamerFactory:
         streamer = create_streamer(str(vcf_file), region="chr21")
         assert streamer.region == "chr21"
 
+    def test_create_streamer_with_threads(self, tmp_path):
+        """Test that the thread count reaches the streamer."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text("##fileformat=VCFv4.2\n")
+
+        assert create_streamer(str(vcf_file), threads=3).threads == 3
+        assert create_streamer("https://example.com/file.vcf.gz", threads=2).threads == 2
+        assert create_streamer(str(vcf_file)).threads >= 1
+
     def test_unsupported_scheme_raises_error(self):
         """Test that unsupported URI schemes raise ValueError."""
         with pytest.raises(ValueError, match="Unsupported source scheme"):
@@ -241,3 +669,46 @@ class TestStreamerFactory:
 
         with pytest.raises(ValueError, match="Unsupported source scheme"):
             create_streamer("s3://bucket/file.vcf.gz")
+
+    def test_create_cyvcf2_streamer(self, tmp_path):
+        """Test selecting the cyvcf2 backend."""
+        vcf_file = tmp_path / "test.vcf"
+        vcf_file.write_text("##fileformat=VCFv4.2\n")
+
+        streamer = create_streamer(f"file://{vcf_file}", backend="cyvcf2")
+        assert isinstance(streamer, CyVCF2Streamer)
+        assert streamer.source == str(vcf_file)
+
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            create_streamer(str(vcf_file), backend="vcfpy")
+
+
+class TestParallelStreamer:
+    """Test create_parallel_streamer region fan-out."""
+
+    def test_streams_regions_in_order(self, tmp_path):
+        """Test that records from every region are yielded, in region order."""
+        vcf_file = tmp_path / "test.vcf"
+        with open(vcf_file, "w") as f:
+            f.write(
+                "##fileformat=VCFv4.2\n"
+                "##contig=<ID=chr21>\n"
+                "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+            )
+            f.writelines(f"chr21\t{pos}\t.\tA\tG\t30\tPASS\t.\n" for pos in range(1, 3000, 10))
+        indexed = pysam.tabix_index(str(vcf_file), preset="vcf")
+
+        records = list(create_parallel_streamer(
+            indexed, ["chr21:1001-2000", "chr21:1-1000"], workers=2
+        ))
+
+        assert len(records) == 200
+        assert records[0].pos == 1001
+        assert records[-1].pos == 991
+        assert records[0].alts == ("G",)
+
+    def test_unsupported_backend_raises_error(self):
+        """Test that the backend is checked before any worker starts."""
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            list(create_parallel_streamer("test.vcf.gz", ["chr21"], backend="vcfpy"))
+